@@ -185,6 +185,68 @@ def infer_quantity(
     return None
 
 
+def _cleaned_number(col: str, strip: str) -> pl.Expr:
+    """Strip *col* and remove the characters in the *strip* class.
+
+    Empty results become null so they are not cast to a number.
+
+    Args:
+        col: Name of a string column.
+        strip: Regex character class of characters to remove.
+
+    Returns:
+        A string expression, null where nothing is left.
+    """
+    cleaned = (
+        pl.col(col).cast(pl.String).str.strip_chars().str.replace_all(strip, "")
+    )
+    return pl.when(cleaned != "").then(cleaned)
+
+
+def safe_float_expr(col: str) -> pl.Expr:
+    """Columnar equivalent of :func:`safe_float_str`.
+
+    Args:
+        col: Name of a string column.
+
+    Returns:
+        A Float64 expression, null where the value is not numeric.
+    """
+    return _cleaned_number(col, r"[,$ ]").cast(pl.Float64, strict=False)
+
+
+def infer_quantity_expr(reference: str, quantity_raw: str) -> pl.Expr:
+    """Columnar equivalent of :func:`infer_quantity`.
+
+    Args:
+        reference: Name of the reference designator column.
+        quantity_raw: Name of the raw quantity column.
+
+    Returns:
+        An Int64 expression with the inferred quantity.
+    """
+    qty = (
+        _cleaned_number(quantity_raw, r"[, ]")
+        .cast(pl.Float64, strict=False)
+        .cast(pl.Int64, strict=False)
+    )
+    ref = pl.col(reference).cast(pl.String)
+    designators = (
+        ref.str.split(",")
+        .list.eval(pl.element().str.strip_chars())
+        .list.eval(pl.element().filter(pl.element() != ""))
+        .list.len()
+        .cast(pl.Int64)
+    )
+    return pl.coalesce(
+        qty,
+        pl.when(
+            ref.str.contains(",", literal=True) & (designators > 0)
+        ).then(designators),
+        pl.when(ref.str.strip_chars() != "").then(pl.lit(1, pl.Int64)),
+    )
+
+
 # ── File parsers ───────────────────────────────────────────────────────
 
 _TABULAR_EXTENSIONS = frozenset({
@@ -256,6 +256,7 @@ def open_connection(path: Path = DB_PATH) -> sqlite3.Connection:
     conn.execute("PRAGMA journal_mode = WAL")
     conn.execute("PRAGMA synchronous = NORMAL")
     conn.execute("PRAGMA cache_size = -64000")
+    conn.execute("PRAGMA temp_store = MEMORY")
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -294,6 +295,28 @@ def transaction(path: Path = DB_PATH) -> Generator[sqlite3.Connection, None, Non
         conn.close()
 
 
+_UPSERT_PROJECT_SQL = """\
+    INSERT INTO projects
+        (source, source_id, name, description, url, repo_url,
+         documentation_url, author, country, category,
+         created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source, source_id) DO UPDATE SET
+        description       = COALESCE(excluded.description, projects.description),
+        url               = COALESCE(excluded.url, projects.url),
+        repo_url          = COALESCE(excluded.repo_url, projects.repo_url),
+        documentation_url = COALESCE(
+            excluded.documentation_url,
+            projects.documentation_url
+        ),
+        author            = COALESCE(excluded.author, projects.author),
+        country           = COALESCE(excluded.country, projects.country),
+        category          = COALESCE(excluded.category, projects.category),
+        created_at        = COALESCE(excluded.created_at, projects.created_at),
+        updated_at        = COALESCE(excluded.updated_at, projects.updated_at)
+"""
+
+
 def upsert_project(
     conn: sqlite3.Connection,
     *,
@@ -334,27 +357,7 @@ def upsert_project(
         The ``projects.id`` for the upserted row.
     """
     cursor = conn.execute(
-        """\
-        INSERT INTO projects
-            (source, source_id, name, description, url, repo_url,
-             documentation_url, author, country, category,
-             created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(source, source_id) DO UPDATE SET
-            description       = COALESCE(excluded.description, projects.description),
-            url               = COALESCE(excluded.url, projects.url),
-            repo_url          = COALESCE(excluded.repo_url, projects.repo_url),
-            documentation_url = COALESCE(
-                excluded.documentation_url,
-                projects.documentation_url
-            ),
-            author            = COALESCE(excluded.author, projects.author),
-            country           = COALESCE(excluded.country, projects.country),
-            category          = COALESCE(excluded.category, projects.category),
-            created_at        = COALESCE(excluded.created_at, projects.created_at),
-            updated_at        = COALESCE(excluded.updated_at, projects.updated_at)
-        RETURNING id
-        """,
+        _UPSERT_PROJECT_SQL + "RETURNING id",
         (
             source,
             source_id,
@@ -375,6 +378,25 @@ def upsert_project(
     return int(row[0])
 
 
+def upsert_projects(
+    conn: sqlite3.Connection,
+    rows: list[tuple[str | None, ...]],
+) -> None:
+    """Insert or update a batch of projects in one statement.
+
+    Callers that need the new ids look them up afterwards by
+    ``(source, source_id)``.
+
+    Args:
+        conn: Active database connection.
+        rows: List of ``(source, source_id, name, description, url,
+            repo_url, documentation_url, author, country, category,
+            created_at, updated_at)`` tuples; see :func:`upsert_project`
+            for the fields and conflict rules.
+    """
+    conn.executemany(_UPSERT_PROJECT_SQL, rows)
+
+
 def insert_tags(
     conn: sqlite3.Connection,
     project_id: int,
@@ -393,6 +415,28 @@ def insert_tags(
     )
 
 
+def insert_project_tags(
+    conn: sqlite3.Connection,
+    rows: list[tuple[int, str]],
+) -> None:
+    """Insert ``(project_id, tag)`` pairs for many projects, skipping duplicates.
+
+    Args:
+        conn: Active database connection.
+        rows: List of ``(project_id, tag)`` tuples with stripped,
+            non-empty tags.
+    """
+    conn.executemany(
+        "INSERT OR IGNORE INTO tags (project_id, tag) VALUES (?, ?)", rows,
+    )
+
+
+_INSERT_LICENSE_SQL = """\
+    INSERT OR IGNORE INTO licenses (project_id, license_type, license_name)
+    VALUES (?, ?, ?)
+"""
+
+
 def insert_license(
     conn: sqlite3.Connection,
     project_id: int,
@@ -408,14 +452,31 @@ def insert_license(
         license_name: License identifier (e.g. ``"CERN-OHL-S-2.0"``).
     """
     conn.execute(
-        """\
-        INSERT OR IGNORE INTO licenses (project_id, license_type, license_name)
-        VALUES (?, ?, ?)
-        """,
-        (project_id, license_type, license_name),
+        _INSERT_LICENSE_SQL, (project_id, license_type, license_name)
     )
 
 
+def insert_licenses(
+    conn: sqlite3.Connection,
+    rows: list[tuple[int, str, str]],
+) -> None:
+    """Insert a batch of license records, skipping duplicates.
+
+    Args:
+        conn: Active database connection.
+        rows: List of ``(project_id, license_type, license_name)`` tuples.
+    """
+    conn.executemany(_INSERT_LICENSE_SQL, rows)
+
+
+_UPSERT_METRIC_SQL = """\
+    INSERT INTO metrics (project_id, metric_name, metric_value)
+    VALUES (?, ?, ?)
+    ON CONFLICT(project_id, metric_name)
+    DO UPDATE SET metric_value = excluded.metric_value
+"""
+
+
 def insert_metric(
     conn: sqlite3.Connection,
     project_id: int,
@@ -431,16 +492,23 @@ def insert_metric(
         metric_value: Integer metric value.
     """
     conn.execute(
-        """\
-        INSERT INTO metrics (project_id, metric_name, metric_value)
-        VALUES (?, ?, ?)
-        ON CONFLICT(project_id, metric_name)
-        DO UPDATE SET metric_value = excluded.metric_value
-        """,
-        (project_id, metric_name, metric_value),
+        _UPSERT_METRIC_SQL, (project_id, metric_name, metric_value),
     )
 
 
+def insert_metrics(
+    conn: sqlite3.Connection,
+    rows: list[tuple[int, str, int | None]],
+) -> None:
+    """Insert or update a batch of engagement metrics.
+
+    Args:
+        conn: Active database connection.
+        rows: List of ``(project_id, metric_name, metric_value)`` tuples.
+    """
+    conn.executemany(_UPSERT_METRIC_SQL, rows)
+
+
 _GARBAGE_MPN = frozenset({
     "", "?", "-", "~", "custom", "ebay", "aliexpress",
     "n/a", "na", "null", "none", "tbd", "tba",
@@ -478,6 +546,14 @@ def sanitize_part_number(raw: str | None) -> str | None:
     return cleaned
 
 
+_INSERT_BOM_COMPONENT_SQL = """\
+    INSERT OR IGNORE INTO bom_components
+        (project_id, reference, component_name, quantity,
+         unit_cost, manufacturer, part_number, footprint)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def insert_bom_component(
     conn: sqlite3.Connection,
     project_id: int,
@@ -510,12 +586,7 @@ def insert_bom_component(
     """
     part_number = sanitize_part_number(part_number)
     conn.execute(
-        """\
-        INSERT OR IGNORE INTO bom_components
-            (project_id, reference, component_name, quantity,
-             unit_cost, manufacturer, part_number, footprint)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+        _INSERT_BOM_COMPONENT_SQL,
         (
             project_id,
             reference,
@@ -529,6 +600,43 @@ def insert_bom_component(
     )
 
 
+def insert_bom_components(
+    conn: sqlite3.Connection,
+    rows: list[
+        tuple[
+            int, str | None, str | None, int | None,
+            float | None, str | None, str | None, str | None,
+        ]
+    ],
+) -> None:
+    """Insert a batch of BOM components in one statement.
+
+    ``part_number`` is sanitized as in :func:`insert_bom_component`.
+
+    Args:
+        conn: Active database connection.
+        rows: List of ``(project_id, reference, component_name,
+            quantity, unit_cost, manufacturer, part_number, footprint)``
+            tuples.
+    """
+    conn.executemany(
+        _INSERT_BOM_COMPONENT_SQL,
+        [
+            (pid, ref, name, qty, cost, mfr,
+             sanitize_part_number(mpn), fp)
+            for pid, ref, name, qty, cost, mfr, mpn, fp in rows
+        ],
+    )
+
+
+_INSERT_PUBLICATION_SQL = """\
+    INSERT OR IGNORE INTO publications
+        (project_id, doi, title, publication_year, journal,
+         cited_by_count, open_access)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def insert_publication(
     conn: sqlite3.Connection,
     project_id: int,
@@ -554,16 +662,30 @@ def insert_publication(
     """
     oa_int = int(open_access) if open_access is not None else None
     conn.execute(
-        """\
-        INSERT OR IGNORE INTO publications
-            (project_id, doi, title, publication_year, journal,
-             cited_by_count, open_access)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
+        _INSERT_PUBLICATION_SQL,
         (project_id, doi, title, publication_year, journal, cited_by_count, oa_int),
     )
 
 
+def insert_publications(
+    conn: sqlite3.Connection,
+    rows: list[
+        tuple[int, str | None, str | None, int | None, str | None,
+              int | None, int | None]
+    ],
+) -> None:
+    """Insert a batch of publications in one statement.
+
+    Args:
+        conn: Active database connection.
+        rows: List of ``(project_id, doi, title, publication_year,
+            journal, cited_by_count, open_access)`` tuples, with
+            ``open_access`` already stored as 0/1; see
+            :func:`insert_publication`.
+    """
+    conn.executemany(_INSERT_PUBLICATION_SQL, rows)
+
+
 def upsert_repo_metrics(
     conn: sqlite3.Connection,
     project_id: int,
@@ -664,6 +786,12 @@ def upsert_repo_metrics(
     )
 
 
+_INSERT_BOM_FILE_PATH_SQL = (
+    "INSERT OR IGNORE INTO bom_file_paths "
+    "(project_id, repo_url, file_path) VALUES (?, ?, ?)"
+)
+
+
 def insert_bom_file_path(
     conn: sqlite3.Connection,
     project_id: int,
@@ -679,12 +807,23 @@ def insert_bom_file_path(
         file_path: Relative path to the BOM file in the repo.
     """
     conn.execute(
-        "INSERT OR IGNORE INTO bom_file_paths "
-        "(project_id, repo_url, file_path) VALUES (?, ?, ?)",
-        (project_id, repo_url, file_path),
+        _INSERT_BOM_FILE_PATH_SQL, (project_id, repo_url, file_path),
     )
 
 
+def insert_bom_file_paths(
+    conn: sqlite3.Connection,
+    rows: list[tuple[int, str, str]],
+) -> None:
+    """Record a batch of BOM file paths in one statement.
+
+    Args:
+        conn: Active database connection.
+        rows: List of ``(project_id, repo_url, file_path)`` tuples.
+    """
+    conn.executemany(_INSERT_BOM_FILE_PATH_SQL, rows)
+
+
 def insert_contributor(
     conn: sqlite3.Connection,
     project_id: int,
@@ -714,6 +853,21 @@ def insert_contributor(
     )
 
 
+_UPSERT_COMPONENT_PRICE_SQL = """\
+    INSERT INTO component_prices
+        (bom_component_id, matched_mpn, distributor, unit_price,
+         currency, quantity_break, price_date, price_source)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(bom_component_id, distributor, quantity_break)
+    DO UPDATE SET
+        matched_mpn  = excluded.matched_mpn,
+        unit_price   = excluded.unit_price,
+        currency     = excluded.currency,
+        price_date   = excluded.price_date,
+        price_source = excluded.price_source
+"""
+
+
 def upsert_component_price(
     conn: sqlite3.Connection,
     bom_component_id: int,
@@ -740,19 +894,7 @@ def upsert_component_price(
         price_source: Source of pricing data (e.g. ``"nexar"``).
     """
     conn.execute(
-        """\
-        INSERT INTO component_prices
-            (bom_component_id, matched_mpn, distributor, unit_price,
-             currency, quantity_break, price_date, price_source)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(bom_component_id, distributor, quantity_break)
-        DO UPDATE SET
-            matched_mpn  = excluded.matched_mpn,
-            unit_price   = excluded.unit_price,
-            currency     = excluded.currency,
-            price_date   = excluded.price_date,
-            price_source = excluded.price_source
-        """,
+        _UPSERT_COMPONENT_PRICE_SQL,
         (
             bom_component_id, matched_mpn, distributor, unit_price,
             currency, quantity_break, price_date, price_source,
@@ -760,6 +902,24 @@ def upsert_component_price(
     )
 
 
+def upsert_component_prices(
+    conn: sqlite3.Connection,
+    rows: list[
+        tuple[int, str | None, str, float, str, int, str, str]
+    ],
+) -> None:
+    """Insert or update a batch of component price records in one statement.
+
+    Args:
+        conn: Active database connection.
+        rows: List of ``(bom_component_id, matched_mpn, distributor,
+            unit_price, currency, quantity_break, price_date,
+            price_source)`` tuples; see :func:`upsert_component_price`
+            for the fields.
+    """
+    conn.executemany(_UPSERT_COMPONENT_PRICE_SQL, rows)
+
+
 def upsert_doc_quality_score(
     conn: sqlite3.Connection,
     project_id: int,
@@ -865,6 +1025,137 @@ def insert_repo_file_tree_entries(
     )
 
 
+_UPSERT_LLM_EVALUATION_SQL = """\
+    INSERT INTO llm_evaluations
+        (project_id, prompt_version, model_id, raw_response,
+         project_type, structure_quality, doc_location,
+         license_present, license_type, license_name,
+         contributing_present, contributing_level,
+         bom_present, bom_completeness, bom_component_count,
+         assembly_present, assembly_detail, assembly_step_count,
+         hw_design_present, hw_editable_source,
+         mech_design_present, mech_editable_source,
+         sw_fw_present, sw_fw_type, sw_fw_doc_level,
+         testing_present, testing_detail,
+         cost_mentioned, suppliers_referenced,
+         part_numbers_present, maturity_stage,
+         hw_license_name, sw_license_name, doc_license_name,
+         evaluated_at)
+    VALUES (
+        ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?,
+        ?, ?,
+        ?, ?, ?,
+        ?, ?, ?,
+        ?, ?,
+        ?, ?,
+        ?, ?, ?,
+        ?, ?,
+        ?, ?,
+        ?, ?,
+        ?, ?, ?,
+        ?
+    )
+    ON CONFLICT(project_id, prompt_version) DO UPDATE SET
+        model_id             = excluded.model_id,
+        raw_response         = excluded.raw_response,
+        project_type         = excluded.project_type,
+        structure_quality    = excluded.structure_quality,
+        doc_location         = excluded.doc_location,
+        license_present      = excluded.license_present,
+        license_type         = excluded.license_type,
+        license_name         = excluded.license_name,
+        contributing_present = excluded.contributing_present,
+        contributing_level   = excluded.contributing_level,
+        bom_present          = excluded.bom_present,
+        bom_completeness     = excluded.bom_completeness,
+        bom_component_count  = excluded.bom_component_count,
+        assembly_present     = excluded.assembly_present,
+        assembly_detail      = excluded.assembly_detail,
+        assembly_step_count  = excluded.assembly_step_count,
+        hw_design_present    = excluded.hw_design_present,
+        hw_editable_source   = excluded.hw_editable_source,
+        mech_design_present  = excluded.mech_design_present,
+        mech_editable_source = excluded.mech_editable_source,
+        sw_fw_present        = excluded.sw_fw_present,
+        sw_fw_type           = excluded.sw_fw_type,
+        sw_fw_doc_level      = excluded.sw_fw_doc_level,
+        testing_present      = excluded.testing_present,
+        testing_detail       = excluded.testing_detail,
+        cost_mentioned       = excluded.cost_mentioned,
+        suppliers_referenced = excluded.suppliers_referenced,
+        part_numbers_present = excluded.part_numbers_present,
+        maturity_stage       = excluded.maturity_stage,
+        hw_license_name      = excluded.hw_license_name,
+        sw_license_name      = excluded.sw_license_name,
+        doc_license_name     = excluded.doc_license_name,
+        evaluated_at         = excluded.evaluated_at
+"""
+
+_LLM_EXTRACTED_COLUMNS = (
+    "project_type",
+    "structure_quality",
+    "doc_location",
+    "license_present",
+    "license_type",
+    "license_name",
+    "contributing_present",
+    "contributing_level",
+    "bom_present",
+    "bom_completeness",
+    "bom_component_count",
+    "assembly_present",
+    "assembly_detail",
+    "assembly_step_count",
+    "hw_design_present",
+    "hw_editable_source",
+    "mech_design_present",
+    "mech_editable_source",
+    "sw_fw_present",
+    "sw_fw_type",
+    "sw_fw_doc_level",
+    "testing_present",
+    "testing_detail",
+    "cost_mentioned",
+    "suppliers_referenced",
+    "part_numbers_present",
+    "maturity_stage",
+    "hw_license_name",
+    "sw_license_name",
+    "doc_license_name",
+)
+
+
+def _llm_evaluation_params(
+    project_id: int,
+    prompt_version: str,
+    model_id: str,
+    raw_response: str,
+    evaluated_at: str,
+    extracted: dict[str, int | str | None] | None,
+) -> tuple[int | str | None, ...]:
+    """Build the bind parameters for ``_UPSERT_LLM_EVALUATION_SQL``.
+
+    Args:
+        project_id: The ``projects.id``.
+        prompt_version: Prompt version identifier.
+        model_id: LLM model identifier.
+        raw_response: Full JSON response text from the LLM.
+        evaluated_at: Timestamp of evaluation (ISO 8601).
+        extracted: Extracted field values, or None for all NULL.
+
+    Returns:
+        Parameter tuple in statement column order.
+    """
+    fields = extracted or {}
+    return (
+        project_id, prompt_version, model_id, raw_response,
+        *map(fields.get, _LLM_EXTRACTED_COLUMNS),
+        evaluated_at,
+    )
+
+
 def upsert_llm_evaluation(
     conn: sqlite3.Connection,
     project_id: int,
@@ -888,107 +1179,40 @@ def upsert_llm_evaluation(
             raw response. Keys must match ``llm_evaluations`` columns.
             If None, all extracted columns are set to NULL.
     """
-    fields = extracted or {}
     conn.execute(
-        """\
-        INSERT INTO llm_evaluations
-            (project_id, prompt_version, model_id, raw_response,
-             project_type, structure_quality, doc_location,
-             license_present, license_type, license_name,
-             contributing_present, contributing_level,
-             bom_present, bom_completeness, bom_component_count,
-             assembly_present, assembly_detail, assembly_step_count,
-             hw_design_present, hw_editable_source,
-             mech_design_present, mech_editable_source,
-             sw_fw_present, sw_fw_type, sw_fw_doc_level,
-             testing_present, testing_detail,
-             cost_mentioned, suppliers_referenced,
-             part_numbers_present, maturity_stage,
-             hw_license_name, sw_license_name, doc_license_name,
-             evaluated_at)
-        VALUES (
-            ?, ?, ?, ?,
-            ?, ?, ?,
-            ?, ?, ?,
-            ?, ?,
-            ?, ?, ?,
-            ?, ?, ?,
-            ?, ?,
-            ?, ?,
-            ?, ?, ?,
-            ?, ?,
-            ?, ?,
-            ?, ?,
-            ?, ?, ?,
-            ?
-        )
-        ON CONFLICT(project_id, prompt_version) DO UPDATE SET
-            model_id             = excluded.model_id,
-            raw_response         = excluded.raw_response,
-            project_type         = excluded.project_type,
-            structure_quality    = excluded.structure_quality,
-            doc_location         = excluded.doc_location,
-            license_present      = excluded.license_present,
-            license_type         = excluded.license_type,
-            license_name         = excluded.license_name,
-            contributing_present = excluded.contributing_present,
-            contributing_level   = excluded.contributing_level,
-            bom_present          = excluded.bom_present,
-            bom_completeness     = excluded.bom_completeness,
-            bom_component_count  = excluded.bom_component_count,
-            assembly_present     = excluded.assembly_present,
-            assembly_detail      = excluded.assembly_detail,
-            assembly_step_count  = excluded.assembly_step_count,
-            hw_design_present    = excluded.hw_design_present,
-            hw_editable_source   = excluded.hw_editable_source,
-            mech_design_present  = excluded.mech_design_present,
-            mech_editable_source = excluded.mech_editable_source,
-            sw_fw_present        = excluded.sw_fw_present,
-            sw_fw_type           = excluded.sw_fw_type,
-            sw_fw_doc_level      = excluded.sw_fw_doc_level,
-            testing_present      = excluded.testing_present,
-            testing_detail       = excluded.testing_detail,
-            cost_mentioned       = excluded.cost_mentioned,
-            suppliers_referenced = excluded.suppliers_referenced,
-            part_numbers_present = excluded.part_numbers_present,
-            maturity_stage       = excluded.maturity_stage,
-            hw_license_name      = excluded.hw_license_name,
-            sw_license_name      = excluded.sw_license_name,
-            doc_license_name     = excluded.doc_license_name,
-            evaluated_at         = excluded.evaluated_at
-        """,
-        (
-            project_id, prompt_version, model_id, raw_response,
-            fields.get("project_type"),
-            fields.get("structure_quality"),
-            fields.get("doc_location"),
-            fields.get("license_present"),
-            fields.get("license_type"),
-            fields.get("license_name"),
-            fields.get("contributing_present"),
-            fields.get("contributing_level"),
-            fields.get("bom_present"),
-            fields.get("bom_completeness"),
-            fields.get("bom_component_count"),
-            fields.get("assembly_present"),
-            fields.get("assembly_detail"),
-            fields.get("assembly_step_count"),
-            fields.get("hw_design_present"),
-            fields.get("hw_editable_source"),
-            fields.get("mech_design_present"),
-            fields.get("mech_editable_source"),
-            fields.get("sw_fw_present"),
-            fields.get("sw_fw_type"),
-            fields.get("sw_fw_doc_level"),
-            fields.get("testing_present"),
-            fields.get("testing_detail"),
-            fields.get("cost_mentioned"),
-            fields.get("suppliers_referenced"),
-            fields.get("part_numbers_present"),
-            fields.get("maturity_stage"),
-            fields.get("hw_license_name"),
-            fields.get("sw_license_name"),
-            fields.get("doc_license_name"),
-            evaluated_at,
+        _UPSERT_LLM_EVALUATION_SQL,
+        _llm_evaluation_params(
+            project_id, prompt_version, model_id,
+            raw_response, evaluated_at, extracted,
         ),
     )
+
+
+def upsert_llm_evaluations(
+    conn: sqlite3.Connection,
+    evaluations: list[tuple[int, str, dict[str, int | str | None] | None]],
+    *,
+    prompt_version: str,
+    model_id: str,
+    evaluated_at: str,
+) -> None:
+    """Insert or update a batch of LLM evaluations in one statement.
+
+    Args:
+        conn: Active database connection.
+        evaluations: List of ``(project_id, raw_response, extracted)``
+            tuples; see :func:`upsert_llm_evaluation` for the fields.
+        prompt_version: Prompt version identifier shared by the batch.
+        model_id: LLM model identifier shared by the batch.
+        evaluated_at: Timestamp of evaluation (ISO 8601).
+    """
+    conn.executemany(
+        _UPSERT_LLM_EVALUATION_SQL,
+        [
+            _llm_evaluation_params(
+                pid, prompt_version, model_id,
+                raw, evaluated_at, extracted,
+            )
+            for pid, raw, extracted in evaluations
+        ],
+    )
@@ -34,17 +34,31 @@ Usage::
 
 import argparse
 import concurrent.futures
+import functools
+import itertools
+import mmap
+import os
+import queue
+import random
 import re
+import shutil
+import sqlite3
 import threading
 import time
+from collections.abc import Callable, Iterator
 from datetime import UTC, datetime
+from operator import itemgetter
 from pathlib import Path
+from typing import BinaryIO
 
 import orjson
 from tqdm import tqdm
 
 from osh_datasets.config import DB_PATH, get_logger, require_env
-from osh_datasets.db import open_connection, upsert_llm_evaluation
+from osh_datasets.db import (
+    open_connection,
+    upsert_llm_evaluations,
+)
 
 logger = get_logger(__name__)
 
@@ -55,12 +69,19 @@ _MAX_TREE_ENTRIES = 500
 _MAX_TREE_CHARS = 12_000
 _MAX_OUTPUT_TOKENS = 8192
 _COMMIT_INTERVAL = 50
+_INGEST_BATCH_SIZE = 1000
+_INGEST_CACHE_KIB = 262_144
 _API_TIMEOUT_SECONDS = 60
 _DEFAULT_WORKERS = 20
 _MAX_RETRIES = 3
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_CAP_SECONDS = 60.0
 _INPUT_TOKENS_PER_MINUTE = 3_500_000  # Under 4M paid tier limit
 _TOKEN_BUDGET = 2_800_000  # Under tier-1 3M enqueued-token limit
 _CHARS_PER_TOKEN = 4
+_REQUEST_ENVELOPE_BYTES = 180  # JSONL request wrapper around the two prompts
+_WRITE_BUFFER_BYTES = 1 << 20
+_KEY_PREFIX = "project_"  # Batch request key: "project_<id>"
 
 _PROMPT_DIR = Path(__file__).resolve().parents[3] / "prompt_evaluation" / "test_8"
 _BATCH_DIR = Path(__file__).resolve().parents[3] / "data" / "batch"
@@ -69,6 +90,10 @@ _BATCH_DIR = Path(__file__).resolve().parents[3] / "data" / "batch"
 def _load_prompt_template() -> tuple[str, str]:
     """Load system and user prompt templates from test_8.
 
+    Parsed templates are cached per file path and modification time,
+    so repeated calls skip the read and regex work until the prompt
+    file changes.
+
     Returns:
         Tuple of ``(system_prompt, user_prompt_template)``.
 
@@ -76,24 +101,39 @@ def _load_prompt_template() -> tuple[str, str]:
         FileNotFoundError: If the prompt file does not exist.
     """
     prompt_path = _PROMPT_DIR / "revised_long_prompt.md"
+    return _parse_prompt_file(prompt_path, prompt_path.stat().st_mtime_ns)
+
+
+_SYSTEM_PROMPT_RE = re.compile(r'SYSTEM_PROMPT\s*=\s*"""(.*?)"""', re.DOTALL)
+_USER_PROMPT_RE = re.compile(
+    r'USER_PROMPT_TEMPLATE\s*=\s*"""(.*?)"""', re.DOTALL,
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_prompt_file(prompt_path: Path, mtime_ns: int) -> tuple[str, str]:
+    """Extract the system and user templates from a prompt file.
+
+    Args:
+        prompt_path: Path to the prompt markdown file.
+        mtime_ns: File modification time; only part of the cache key.
+
+    Returns:
+        Tuple of ``(system_prompt, user_prompt_template)``.
+
+    Raises:
+        ValueError: If either template is missing from the file.
+    """
     text = prompt_path.read_text(encoding="utf-8")
 
     # Extract SYSTEM_PROMPT between first pair of triple-quotes
-    sys_match = re.search(
-        r'SYSTEM_PROMPT\s*=\s*"""(.*?)"""',
-        text,
-        re.DOTALL,
-    )
+    sys_match = _SYSTEM_PROMPT_RE.search(text)
     if not sys_match:
         raise ValueError("Cannot find SYSTEM_PROMPT in prompt file")
     system = sys_match.group(1).strip()
 
     # Extract USER_PROMPT_TEMPLATE between second pair of triple-quotes
-    user_match = re.search(
-        r'USER_PROMPT_TEMPLATE\s*=\s*"""(.*?)"""',
-        text,
-        re.DOTALL,
-    )
+    user_match = _USER_PROMPT_RE.search(text)
     if not user_match:
         raise ValueError("Cannot find USER_PROMPT_TEMPLATE in prompt file")
     user = user_match.group(1).strip()
@@ -101,14 +141,110 @@ def _load_prompt_template() -> tuple[str, str]:
     return system, user
 
 
+# READMEs are cut to one character past the prompt limit in SQL so the
+# full text of very large READMEs never reaches Python;
+# ``_build_user_prompt`` still sees the overflow and marks truncation.
+_CANDIDATES_SQL = f"""\
+    SELECT rc.project_id, SUBSTR(rc.content, 1, {_MAX_README_CHARS + 1})
+    FROM readme_contents rc
+    WHERE rc.content IS NOT NULL
+      AND EXISTS (
+          SELECT 1 FROM repo_file_trees rft
+          WHERE rft.project_id = rc.project_id
+      )
+      AND NOT EXISTS (
+          SELECT 1 FROM llm_evaluations le
+          WHERE le.project_id = rc.project_id
+            AND le.prompt_version = ?
+      )
+    ORDER BY rc.project_id
+    LIMIT ?
+"""
+
+
+def _iter_candidates(
+    conn: sqlite3.Connection,
+    prompt_version: str,
+    limit: int = 0,
+) -> Iterator[tuple[int, str, list[tuple[str, str, int | None]]]]:
+    """Stream README and file tree for every unevaluated project.
+
+    Issues one query for the candidate READMEs and one for all of
+    their file tree rows (ordered by project, then path), and walks
+    the two cursors in step instead of querying once per project.
+    Rows are read from SQLite as they are consumed, so memory stays
+    flat however many candidates there are.
+
+    Args:
+        conn: Active database connection.
+        prompt_version: Prompt version identifier.
+        limit: Maximum projects to return (0 = all).
+
+    Yields:
+        ``(project_id, readme_content, tree_entries)`` tuples ordered
+        by project ID.
+    """
+    params = (prompt_version, limit if limit > 0 else -1)
+    candidates = conn.execute(_CANDIDATES_SQL, params)
+    tree_rows = conn.execute(
+        f"""\
+        SELECT project_id, file_path, file_type, size_bytes
+        FROM repo_file_trees
+        WHERE project_id IN (
+            SELECT project_id FROM ({_CANDIDATES_SQL})
+        )
+        ORDER BY project_id, file_path
+        """,
+        params,
+    )
+    trees = itertools.groupby(tree_rows, key=itemgetter(0))
+    tree = next(trees, None)
+    for pid, readme in candidates:
+        while tree is not None and tree[0] < pid:
+            tree = next(trees, None)
+        entries: list[tuple[str, str, int | None]] = []
+        if tree is not None and tree[0] == pid:
+            entries = [(r[1], r[2], r[3]) for r in tree[1]]
+        yield pid, readme, entries
+
+
+def _fetch_candidates(
+    conn: sqlite3.Connection,
+    prompt_version: str,
+    limit: int = 0,
+) -> list[tuple[int, str, list[tuple[str, str, int | None]]]]:
+    """Load README and file tree for every unevaluated project.
+
+    List form of :func:`_iter_candidates`, for callers that need the
+    candidate count up front.
+
+    Args:
+        conn: Active database connection.
+        prompt_version: Prompt version identifier.
+        limit: Maximum projects to return (0 = all).
+
+    Returns:
+        List of ``(project_id, readme_content, tree_entries)`` tuples
+        ordered by project ID.
+    """
+    return list(_iter_candidates(conn, prompt_version, limit))
+
+
 def format_directory_tree(
     entries: list[tuple[str, str, int | None]],
+    presorted: bool = False,
 ) -> str:
     """Render file tree entries as indented text for prompt insertion.
 
+    Stops consuming entries as soon as the entry or character cap is
+    reached, so oversized trees are never rendered in full.
+
     Args:
         entries: List of ``(path, type, size)`` tuples from
             ``repo_file_trees``.
+        presorted: Whether ``entries`` are already ordered by path
+            (e.g. fetched with ``ORDER BY file_path``), skipping the
+            sort.
 
     Returns:
         Formatted directory tree string.
@@ -117,30 +253,46 @@ def format_directory_tree(
         return "(empty repository)"
 
     # Sort by path for consistent output
-    sorted_entries = sorted(entries, key=lambda e: e[0])
-
-    # Cap at max entries
-    if len(sorted_entries) > _MAX_TREE_ENTRIES:
-        sorted_entries = sorted_entries[:_MAX_TREE_ENTRIES]
+    ordered = entries if presorted else sorted(entries, key=itemgetter(0))
 
     lines: list[str] = []
-    for path, ftype, _size in sorted_entries:
-        if ftype == "tree":
-            lines.append(f"{path}/")
-        else:
-            lines.append(path)
+    length = -1  # length of "\n".join(lines)
+    for path, ftype, _size in itertools.islice(ordered, _MAX_TREE_ENTRIES):
+        line = f"{path}/" if ftype == "tree" else path
+        lines.append(line)
+        length += len(line) + 1
+        if length > _MAX_TREE_CHARS:
+            return "\n".join(lines)[:_MAX_TREE_CHARS] + "\n\n[TREE TRUNCATED]"
+
+    return "\n".join(lines)
+
 
-    tree_text = "\n".join(lines)
+_PLACEHOLDER_RE = re.compile(r"(\{directory_structure\}|\{readme_content\})")
 
-    # Cap at max chars
-    if len(tree_text) > _MAX_TREE_CHARS:
-        tree_text = tree_text[:_MAX_TREE_CHARS] + "\n\n[TREE TRUNCATED]"
 
-    return tree_text
+def _split_user_template(template: str) -> tuple[str, ...]:
+    """Pre-split the user prompt template around its placeholders.
+
+    The doubled braces used in the JSON schema example are unescaped
+    (``{{`` -> ``{``, ``}}`` -> ``}``) once here rather than on every
+    filled prompt.
+
+    Args:
+        template: User prompt template with placeholders.
+
+    Returns:
+        Alternating literal fragments (even indices) and placeholder
+        names (odd indices), ready for :func:`_build_user_prompt`.
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    parts[0::2] = [
+        p.replace("{{", "{").replace("}}", "}") for p in parts[0::2]
+    ]
+    return tuple(parts)
 
 
 def _build_user_prompt(
-    template: str,
+    fragments: tuple[str, ...],
     readme_content: str,
     directory_tree: str,
 ) -> str:
@@ -150,7 +302,7 @@ def _build_user_prompt(
     the JSON schema at the end of the prompt is never truncated.
 
     Args:
-        template: User prompt template with placeholders.
+        fragments: Template split by :func:`_split_user_template`.
         readme_content: Raw README markdown text.
         directory_tree: Formatted directory tree string.
 
@@ -165,14 +317,16 @@ def _build_user_prompt(
     else:
         readme_insert = readme_content
 
-    # Replace placeholders first, then unescape the doubled
-    # braces used in the JSON schema example ({{ -> {, }} -> }).
-    filled = template.replace(
-        "{directory_structure}", directory_tree
-    ).replace(
-        "{readme_content}", readme_insert
-    )
-    return filled.replace("{{", "{").replace("}}", "}")
+    values = {
+        "{directory_structure}": directory_tree,
+        "{readme_content}": readme_insert,
+    }
+    parts = list(fragments)
+    parts[1::2] = [values[p] for p in fragments[1::2]]
+    return "".join(parts)
+
+
+_INVALID_ESCAPE_RE = re.compile(r'\\(?!["\\/bfnrtu])')
 
 
 def _fix_invalid_escapes(json_str: str) -> str:
@@ -190,7 +344,14 @@ def _fix_invalid_escapes(json_str: str) -> str:
     Returns:
         Sanitized JSON string safe for strict parsers.
     """
-    return re.sub(r'\\(?!["\\/bfnrtu])', r"\\\\", json_str)
+    return _INVALID_ESCAPE_RE.sub(r"\\\\", json_str)
+
+
+# Tokens that matter to the brace scan in ``parse_response``: a whole
+# string literal (escapes included; an unterminated one runs to the end
+# of the text) or a single brace. Everything else is skipped by the
+# regex engine rather than stepped over one character at a time.
+_JSON_SCAN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"?|[{}]', re.DOTALL)
 
 
 def parse_response(raw: str) -> dict[str, object] | None:
@@ -213,39 +374,40 @@ def parse_response(raw: str) -> dict[str, object] | None:
         logger.warning("No JSON found in response")
         return None
 
-    depth = 0
-    in_string = False
-    escape_next = False
+    # Fast path: usually nothing but a closing fence follows the object,
+    # so the span up to the last "}" is the whole object. If it parses,
+    # the brace scan below would have found the same span.
+    end = raw.rfind("}")
+    if end > start:
+        try:
+            parsed = orjson.loads(raw[start : end + 1])
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            return parsed  # type: ignore[no-any-return]
 
-    for i in range(start, len(raw)):
-        ch = raw[i]
-        if escape_next:
-            escape_next = False
-            continue
-        if ch == "\\" and in_string:
-            escape_next = True
-            continue
-        if ch == '"':
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-        if ch == "{":
+    depth = 0
+    for match in _JSON_SCAN_RE.finditer(raw, start):
+        token = match.group()
+        if token == "{":
             depth += 1
-        elif ch == "}":
+        elif token == "}":
             depth -= 1
             if depth == 0:
-                json_str = raw[start : i + 1]
+                json_str = raw[start : match.end()]
                 try:
-                    parsed = orjson.loads(
-                        json_str.encode("utf-8")
-                    )
-                except orjson.JSONDecodeError:
+                    parsed = orjson.loads(json_str)
+                except orjson.JSONDecodeError as exc:
+                    # Only rewrite when there is an invalid escape to
+                    # fix; otherwise the retry would fail identically.
+                    if _INVALID_ESCAPE_RE.search(json_str) is None:
+                        logger.warning(
+                            "JSON parse error: %s", exc
+                        )
+                        return None
                     json_str = _fix_invalid_escapes(json_str)
                     try:
-                        parsed = orjson.loads(
-                            json_str.encode("utf-8")
-                        )
+                        parsed = orjson.loads(json_str)
                     except orjson.JSONDecodeError as exc:
                         logger.warning(
                             "JSON parse error: %s", exc
@@ -260,11 +422,85 @@ def parse_response(raw: str) -> dict[str, object] | None:
     return None
 
 
+# Declarative extraction table walked by ``extract_fields``. Each entry
+# is ``(section_path, required_key, columns)``: ``section_path`` leads
+# to a nested dict (a missing key counts as ``{}``), ``required_key``
+# (if set) must be truthy in that dict for any column to be written,
+# and each column is ``(json_key, db_column, kind)`` where ``kind`` is
+# ``"raw"`` (as-is), ``"flag"`` (0/1) or ``"count"`` (int, 0 if falsy).
+_EXTRACTION_SPEC: tuple[
+    tuple[tuple[str, ...], str | None, tuple[tuple[str, str, str], ...]],
+    ...,
+] = (
+    (("metadata",), None, (
+        ("project_type", "project_type", "raw"),
+        ("structure_quality", "structure_quality", "raw"),
+        ("documentation_location", "doc_location", "raw"),
+    )),
+    (("license",), None, (
+        ("present", "license_present", "flag"),
+        ("type", "license_type", "raw"),
+        ("name", "license_name", "raw"),
+    )),
+    (("contributing",), None, (
+        ("present", "contributing_present", "flag"),
+        ("level", "contributing_level", "raw"),
+    )),
+    (("bom",), None, (
+        ("present", "bom_present", "flag"),
+        ("completeness", "bom_completeness", "raw"),
+        ("component_count", "bom_component_count", "count"),
+    )),
+    (("assembly",), None, (
+        ("present", "assembly_present", "flag"),
+        ("detail_level", "assembly_detail", "raw"),
+        ("step_count", "assembly_step_count", "count"),
+    )),
+    (("design_files", "hardware"), None, (
+        ("present", "hw_design_present", "flag"),
+        ("has_editable_source", "hw_editable_source", "flag"),
+    )),
+    (("design_files", "mechanical"), None, (
+        ("present", "mech_design_present", "flag"),
+        ("has_editable_source", "mech_editable_source", "flag"),
+    )),
+    (("software_firmware",), None, (
+        ("present", "sw_fw_present", "flag"),
+        ("type", "sw_fw_type", "raw"),
+        ("documentation_level", "sw_fw_doc_level", "raw"),
+    )),
+    (("testing",), None, (
+        ("present", "testing_present", "flag"),
+        ("detail_level", "testing_detail", "raw"),
+    )),
+    (("cost_sourcing",), None, (
+        ("estimated_cost_mentioned", "cost_mentioned", "flag"),
+        ("suppliers_referenced", "suppliers_referenced", "flag"),
+        ("part_numbers_present", "part_numbers_present", "flag"),
+    )),
+    (("project_maturity",), None, (
+        ("stage", "maturity_stage", "raw"),
+    )),
+    (("specific_licenses", "hardware"), "present", (
+        ("name", "hw_license_name", "raw"),
+    )),
+    (("specific_licenses", "software"), "present", (
+        ("name", "sw_license_name", "raw"),
+    )),
+    (("specific_licenses", "documentation"), "present", (
+        ("name", "doc_license_name", "raw"),
+    )),
+)
+
+
 def extract_fields(
     parsed: dict[str, object],
 ) -> dict[str, int | str | None]:
     """Flatten nested LLM JSON response into DB column values.
 
+    Walks ``_EXTRACTION_SPEC``; sections that are present but not
+    objects are skipped.
+
     Args:
         parsed: Parsed JSON dict from the LLM response.
 
@@ -273,107 +509,21 @@ def extract_fields(
     """
     fields: dict[str, int | str | None] = {}
 
-    # Metadata
-    meta = parsed.get("metadata", {})
-    if isinstance(meta, dict):
-        fields["project_type"] = meta.get("project_type")
-        fields["structure_quality"] = meta.get("structure_quality")
-        fields["doc_location"] = meta.get("documentation_location")
-
-    # License
-    lic = parsed.get("license", {})
-    if isinstance(lic, dict):
-        fields["license_present"] = int(bool(lic.get("present")))
-        fields["license_type"] = lic.get("type")
-        fields["license_name"] = lic.get("name")
-
-    # Contributing
-    contrib = parsed.get("contributing", {})
-    if isinstance(contrib, dict):
-        fields["contributing_present"] = int(
-            bool(contrib.get("present"))
-        )
-        fields["contributing_level"] = contrib.get("level")
-
-    # BOM
-    bom = parsed.get("bom", {})
-    if isinstance(bom, dict):
-        fields["bom_present"] = int(bool(bom.get("present")))
-        fields["bom_completeness"] = bom.get("completeness")
-        count = bom.get("component_count", 0)
-        fields["bom_component_count"] = int(count) if count else 0
-
-    # Assembly
-    asm = parsed.get("assembly", {})
-    if isinstance(asm, dict):
-        fields["assembly_present"] = int(bool(asm.get("present")))
-        fields["assembly_detail"] = asm.get("detail_level")
-        steps = asm.get("step_count", 0)
-        fields["assembly_step_count"] = int(steps) if steps else 0
-
-    # Design files
-    design = parsed.get("design_files", {})
-    if isinstance(design, dict):
-        hw = design.get("hardware", {})
-        if isinstance(hw, dict):
-            fields["hw_design_present"] = int(
-                bool(hw.get("present"))
-            )
-            fields["hw_editable_source"] = int(
-                bool(hw.get("has_editable_source"))
-            )
-        mech = design.get("mechanical", {})
-        if isinstance(mech, dict):
-            fields["mech_design_present"] = int(
-                bool(mech.get("present"))
-            )
-            fields["mech_editable_source"] = int(
-                bool(mech.get("has_editable_source"))
-            )
-
-    # Software/firmware
-    sw = parsed.get("software_firmware", {})
-    if isinstance(sw, dict):
-        fields["sw_fw_present"] = int(bool(sw.get("present")))
-        fields["sw_fw_type"] = sw.get("type")
-        fields["sw_fw_doc_level"] = sw.get("documentation_level")
-
-    # Testing
-    test = parsed.get("testing", {})
-    if isinstance(test, dict):
-        fields["testing_present"] = int(bool(test.get("present")))
-        fields["testing_detail"] = test.get("detail_level")
-
-    # Cost/sourcing
-    cost = parsed.get("cost_sourcing", {})
-    if isinstance(cost, dict):
-        fields["cost_mentioned"] = int(
-            bool(cost.get("estimated_cost_mentioned"))
-        )
-        fields["suppliers_referenced"] = int(
-            bool(cost.get("suppliers_referenced"))
-        )
-        fields["part_numbers_present"] = int(
-            bool(cost.get("part_numbers_present"))
-        )
-
-    # Maturity
-    mat = parsed.get("project_maturity", {})
-    if isinstance(mat, dict):
-        fields["maturity_stage"] = mat.get("stage")
-
-    # Domain-specific licenses
-    spec = parsed.get("specific_licenses", {})
-    if isinstance(spec, dict):
-        hw_lic = spec.get("hardware", {})
-        if isinstance(hw_lic, dict) and hw_lic.get("present"):
-            fields["hw_license_name"] = hw_lic.get("name")
-        sw_lic = spec.get("software", {})
-        if isinstance(sw_lic, dict) and sw_lic.get("present"):
-            fields["sw_license_name"] = sw_lic.get("name")
-        doc_lic = spec.get("documentation", {})
-        if isinstance(doc_lic, dict) and doc_lic.get("present"):
-            fields["doc_license_name"] = doc_lic.get("name")
+    for path, required, columns in _EXTRACTION_SPEC:
+        section: object = parsed
+        for key in path:
+            section = section.get(key, {}) if isinstance(section, dict) else None
+        if not isinstance(section, dict):
+            continue
+        if required is not None and not section.get(required):
+            continue
+        for key, column, kind in columns:
+            value = section.get(key)
+            if kind == "flag":
+                value = int(bool(value))
+            elif kind == "count":
+                value = int(value) if value else 0
+            fields[column] = value
 
     return fields
 
@@ -396,23 +546,110 @@ class _TokenBucket:
         self._capacity = tokens_per_second  # 1-second burst
         self._tokens = tokens_per_second
         self._last = time.monotonic()
-        self._lock = threading.Lock()
+        self._cond = threading.Condition()
 
     def acquire(self, count: int) -> None:
-        """Block until ``count`` tokens are available."""
-        while True:
-            with self._lock:
+        """Block until ``count`` tokens are available.
+
+        Waits exactly as long as the refill rate needs to cover the
+        deficit instead of polling, releasing the lock meanwhile.
+        """
+        with self._cond:
+            while True:
                 now = time.monotonic()
-                elapsed = now - self._last
                 self._tokens = min(
                     self._capacity,
-                    self._tokens + elapsed * self._rate,
+                    self._tokens + (now - self._last) * self._rate,
                 )
                 self._last = now
                 if self._tokens >= count:
                     self._tokens -= count
                     return
-            time.sleep(0.1)
+                self._cond.wait(
+                    timeout=(count - self._tokens) / self._rate,
+                )
+
+
+def _retry_after_seconds(exc: Exception) -> float | None:
+    """Read the server-requested retry delay from a rate-limit error.
+
+    Checks the HTTP ``Retry-After`` header first, then the
+    ``google.rpc.RetryInfo`` ``retryDelay`` (e.g. ``"30s"``) carried
+    in the error body of google-genai ``APIError`` exceptions.
+
+    Args:
+        exc: Exception raised by the Gemini client.
+
+    Returns:
+        Delay in seconds, or None if the error carries no hint.
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        try:
+            return float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            pass
+
+    details = getattr(exc, "details", None)
+    error = details.get("error") if isinstance(details, dict) else None
+    entries = error.get("details") if isinstance(error, dict) else None
+    for entry in entries if isinstance(entries, list) else []:
+        delay = entry.get("retryDelay") if isinstance(entry, dict) else None
+        if isinstance(delay, str) and delay.endswith("s"):
+            try:
+                return float(delay[:-1])
+            except ValueError:
+                return None
+    return None
+
+
+def _parse_generate_content_body(body: str | None) -> tuple[str, int, int]:
+    """Extract text and token usage from a raw ``generateContent`` body.
+
+    Mirrors ``GenerateContentResponse.text``: concatenates the text of
+    the first candidate's non-thought parts. Nodes of the wrong type
+    are treated as missing, like :func:`_response_text` does for batch
+    results, so a malformed response yields empty text.
+
+    Args:
+        body: Raw JSON response body from the Gemini REST API.
+
+    Returns:
+        Tuple of ``(response_text, input_tokens, output_tokens)``.
+
+    Raises:
+        orjson.JSONDecodeError: If *body* is not valid JSON.
+    """
+    data: object = orjson.loads(body) if body else {}
+    if not isinstance(data, dict):
+        data = {}
+
+    text = ""
+    candidates = data.get("candidates")
+    if isinstance(candidates, list) and candidates:
+        first = candidates[0]
+        content = first.get("content") if isinstance(first, dict) else None
+        parts = content.get("parts") if isinstance(content, dict) else None
+        if isinstance(parts, list):
+            text = "".join(
+                part["text"]
+                for part in parts
+                if isinstance(part, dict)
+                and isinstance(part.get("text"), str)
+                and not part.get("thought")
+            )
+
+    usage = data.get("usageMetadata")
+    if not isinstance(usage, dict):
+        usage = {}
+    input_tokens = usage.get("promptTokenCount")
+    output_tokens = usage.get("candidatesTokenCount")
+    return (
+        text,
+        input_tokens if isinstance(input_tokens, int) else 0,
+        output_tokens if isinstance(output_tokens, int) else 0,
+    )
 
 
 def _call_gemini_realtime(
@@ -426,7 +663,8 @@ def _call_gemini_realtime(
     """Call Gemini API with timeout and retry on rate-limit errors.
 
     Retries up to ``_MAX_RETRIES`` times on 429 errors with
-    exponential backoff. Uses ``rate_limiter`` to throttle requests
+    decorrelated-jitter backoff, never sooner than the delay the
+    server asks for. Uses ``rate_limiter`` to throttle requests
     proactively before hitting the API.
 
     Args:
@@ -442,6 +680,7 @@ def _call_gemini_realtime(
         or ``None`` if the call fails after all retries.
     """
     try:
+        import httpx
         from google.genai import types as genai_types
     except ImportError as exc:
         raise ImportError(
@@ -458,64 +697,67 @@ def _call_gemini_realtime(
                 disable=True,
             )
         ),
+        http_options=genai_types.HttpOptions(
+            timeout=_API_TIMEOUT_SECONDS * 1000,
+        ),
+        # Hand back the raw body; it is decoded with orjson below
+        # instead of stdlib json + pydantic response models.
+        should_return_http_response=True,
     )
 
+    wait = _BACKOFF_BASE_SECONDS
     for attempt in range(_MAX_RETRIES):
         if rate_limiter and est_input_tokens > 0:
             rate_limiter.acquire(est_input_tokens)
 
-        def _do_call() -> tuple[str, int, int]:
+        try:
             resp = client.models.generate_content(  # type: ignore[attr-defined]
                 model=model_id,
                 contents=user_prompt,
                 config=config,
             )
-            text = resp.text or ""
-            usage = resp.usage_metadata
-            in_tok = (
-                usage.prompt_token_count if usage else 0
-            )
-            out_tok = (
-                usage.candidates_token_count if usage else 0
+        except httpx.TimeoutException:
+            logger.error(
+                "Gemini API timed out after %ds",
+                _API_TIMEOUT_SECONDS,
             )
-            return text, in_tok, out_tok
-
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=1,
-        ) as pool:
-            future = pool.submit(_do_call)
-            try:
-                return future.result(
-                    timeout=_API_TIMEOUT_SECONDS,
-                )
-            except concurrent.futures.TimeoutError:
-                logger.error(
-                    "Gemini API timed out after %ds",
-                    _API_TIMEOUT_SECONDS,
+            return None
+        except Exception as exc:
+            exc_str = str(exc)
+            if "429" in exc_str or "RESOURCE_EXHAUSTED" in exc_str:
+                # Decorrelated jitter, floored by the server's hint
+                wait = min(
+                    _BACKOFF_CAP_SECONDS,
+                    random.uniform(_BACKOFF_BASE_SECONDS, wait * 3),
                 )
-                return None
-            except Exception as exc:
-                exc_str = str(exc)
-                if "429" in exc_str or "RESOURCE_EXHAUSTED" in exc_str:
-                    wait = 2 ** (attempt + 1)
-                    logger.warning(
-                        "Rate limited (attempt %d/%d), "
-                        "retrying in %ds",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        wait,
-                    )
-                    time.sleep(wait)
-                    continue
-                logger.error(
-                    "Gemini API call failed: %s", exc,
+                wait = max(wait, _retry_after_seconds(exc) or 0.0)
+                logger.warning(
+                    "Rate limited (attempt %d/%d), "
+                    "retrying in %.1fs",
+                    attempt + 1,
+                    _MAX_RETRIES,
+                    wait,
                 )
-                return None
+                time.sleep(wait)
+                continue
+            logger.error(
+                "Gemini API call failed: %s", exc,
+            )
+            return None
+
+        try:
+            return _parse_generate_content_body(resp.sdk_http_response.body)
+        except (orjson.JSONDecodeError, AttributeError, TypeError, LookupError) as exc:
+            logger.error("Gemini API returned an unreadable body: %s", exc)
+            return None
 
     logger.error("Gemini API exhausted %d retries", _MAX_RETRIES)
     return None
 
 
+_CallFuture = concurrent.futures.Future[tuple[str, int, int] | None]
+
+
 def run_realtime(
     db_path: Path = DB_PATH,
     prompt_version: str = "test_8",
@@ -525,9 +767,10 @@ def run_realtime(
 ) -> None:
     """Evaluate projects via concurrent real-time Gemini API calls.
 
-    Pre-fetches all candidate data (README + file tree), builds
-    prompts, then fires up to ``max_workers`` concurrent API calls.
-    DB writes happen on the main thread as futures complete.
+    Pre-fetches all candidate data (README + file tree), then builds
+    each prompt and submits it to up to ``max_workers`` concurrent
+    API calls. DB writes happen on the main thread as futures
+    complete.
 
     Args:
         db_path: Path to the SQLite database file.
@@ -550,31 +793,11 @@ def run_realtime(
     api_key = require_env("GEMINI_API_KEY")
     client = genai.Client(api_key=api_key)
     system_prompt, user_template = _load_prompt_template()
+    fragments = _split_user_template(user_template)
 
     conn = open_connection(db_path)
     try:
-        query = """\
-            SELECT rc.project_id, rc.content
-            FROM readme_contents rc
-            WHERE rc.content IS NOT NULL
-              AND EXISTS (
-                  SELECT 1 FROM repo_file_trees rft
-                  WHERE rft.project_id = rc.project_id
-              )
-              AND NOT EXISTS (
-                  SELECT 1 FROM llm_evaluations le
-                  WHERE le.project_id = rc.project_id
-                    AND le.prompt_version = ?
-              )
-            ORDER BY rc.project_id
-        """
-        params: tuple[str, ...] | tuple[str, int] = (
-            prompt_version,
-        )
-        if limit > 0:
-            query += "\n            LIMIT ?"
-            params = (prompt_version, limit)
-        candidates = conn.execute(query, params).fetchall()
+        candidates = _fetch_candidates(conn, prompt_version, limit)
 
         if not candidates:
             logger.info("No candidates for realtime evaluation")
@@ -590,40 +813,15 @@ def run_realtime(
             max_workers,
         )
 
-        # Pre-build all prompts (I/O from DB, CPU for formatting)
-        work_items: list[tuple[int, str]] = []
-        for row in tqdm(
-            candidates,
-            desc="Building prompts",
-            unit="project",
-        ):
-            project_id: int = row[0]
-            readme_content: str = row[1]
-            tree_rows = conn.execute(
-                """\
-                SELECT file_path, file_type, size_bytes
-                FROM repo_file_trees
-                WHERE project_id = ?
-                ORDER BY file_path
-                """,
-                (project_id,),
-            ).fetchall()
-            tree_entries: list[tuple[str, str, int | None]] = [
-                (r[0], r[1], r[2]) for r in tree_rows
-            ]
-            tree_text = format_directory_tree(tree_entries)
-            user_prompt = _build_user_prompt(
-                user_template, readme_content, tree_text,
-            )
-            work_items.append((project_id, user_prompt))
-
         success_count = 0
         fail_count = 0
         parse_fail_count = 0
         total_input_tokens = 0
         total_output_tokens = 0
         now = datetime.now(UTC).isoformat()
-        writes_since_commit = 0
+        pending: list[
+            tuple[int, str, dict[str, int | str | None] | None]
+        ] = []
 
         # Rate limiter: 3.5M tokens/min = ~58k tokens/sec
         bucket = _TokenBucket(
@@ -634,12 +832,19 @@ def run_realtime(
         with concurrent.futures.ThreadPoolExecutor(
             max_workers=max_workers,
         ) as pool:
-            future_to_pid: dict[
-                concurrent.futures.Future[
-                    tuple[str, int, int] | None
-                ],
-                int,
-            ] = {
+            # Prompts are built as they are submitted so the first
+            # API calls overlap with formatting the remaining ones.
+            # Each future reports itself on ``done`` when it finishes.
+            done: queue.SimpleQueue[tuple[int, _CallFuture]] = queue.SimpleQueue()
+
+            def _report(pid: int) -> Callable[[_CallFuture], None]:
+                return lambda future: done.put((pid, future))
+
+            for pid, readme_content, tree_entries in candidates:
+                tree_text = format_directory_tree(tree_entries, presorted=True)
+                prompt = _build_user_prompt(
+                    fragments, readme_content, tree_text,
+                )
                 pool.submit(
                     _call_gemini_realtime,
                     client,
@@ -648,18 +853,15 @@ def run_realtime(
                     prompt,
                     bucket,
                     len(prompt) // _CHARS_PER_TOKEN,
-                ): pid
-                for pid, prompt in work_items
-            }
+                ).add_done_callback(_report(pid))
 
             progress = tqdm(
-                concurrent.futures.as_completed(future_to_pid),
-                total=total,
+                range(total),
                 desc="Evaluating (0 ok, 0 fail)",
                 unit="project",
             )
-            for future in progress:
-                pid = future_to_pid[future]
+            for _ in progress:
+                pid, future = done.get()
                 result = future.result()
 
                 if result is None:
@@ -690,28 +892,32 @@ def run_realtime(
                     )
                     continue
 
-                extracted = extract_fields(parsed)
-                upsert_llm_evaluation(
-                    conn,
-                    pid,
-                    prompt_version=prompt_version,
-                    model_id=model_id,
-                    raw_response=raw_text,
-                    evaluated_at=now,
-                    extracted=extracted,
-                )
+                pending.append((pid, raw_text, extract_fields(parsed)))
                 success_count += 1
-                writes_since_commit += 1
 
                 progress.set_description(
                     f"Evaluating ({success_count} ok, "
                     f"{fail_count} fail)"
                 )
 
-                if writes_since_commit >= _COMMIT_INTERVAL:
+                if len(pending) >= _COMMIT_INTERVAL:
+                    upsert_llm_evaluations(
+                        conn,
+                        pending,
+                        prompt_version=prompt_version,
+                        model_id=model_id,
+                        evaluated_at=now,
+                    )
                     conn.commit()
-                    writes_since_commit = 0
-
+                    pending.clear()
+
+        upsert_llm_evaluations(
+            conn,
+            pending,
+            prompt_version=prompt_version,
+            model_id=model_id,
+            evaluated_at=now,
+        )
         conn.commit()
     finally:
         conn.close()
@@ -730,6 +936,53 @@ def run_realtime(
 # ── Phase 1: Prepare ─────────────────────────────────────────────
 
 
+_KEY_SLOT = "\x00key\x00"
+_PROMPT_SLOT = "\x00user_prompt\x00"
+
+
+def _batch_request_template(system_prompt: str) -> tuple[bytes, bytes, bytes]:
+    """Serialize the invariant parts of a batch request line once.
+
+    The system prompt and generation config are identical for every
+    request, so they are encoded a single time and only the key and
+    user prompt are serialized per project.
+
+    Args:
+        system_prompt: System instruction text.
+
+    Returns:
+        ``(head, middle, tail)`` such that
+        ``head + key_json + middle + prompt_json + tail`` is one JSONL
+        request line (``tail`` includes the trailing newline).
+    """
+    skeleton = orjson.dumps(
+        {
+            "key": _KEY_SLOT,
+            "request": {
+                "system_instruction": {
+                    "parts": [{"text": system_prompt}],
+                },
+                "contents": [
+                    {
+                        "role": "user",
+                        "parts": [{"text": _PROMPT_SLOT}],
+                    },
+                ],
+                "generation_config": {
+                    "temperature": 0,
+                    "max_output_tokens": _MAX_OUTPUT_TOKENS,
+                },
+            },
+        },
+        option=orjson.OPT_APPEND_NEWLINE,
+    )
+    # The key precedes and the prompt follows the system prompt text,
+    # so splitting from the outside in can't hit a slot inside it.
+    head, rest = skeleton.split(orjson.dumps(_KEY_SLOT), 1)
+    middle, tail = rest.rsplit(orjson.dumps(_PROMPT_SLOT), 1)
+    return head, middle, tail
+
+
 def prepare_batch(
     db_path: Path = DB_PATH,
     prompt_version: str = "test_8",
@@ -747,81 +1000,40 @@ def prepare_batch(
         Path to the generated JSONL batch file.
     """
     system_prompt, user_template = _load_prompt_template()
-    conn = open_connection(db_path)
-
-    candidates = conn.execute(
-        """\
-        SELECT rc.project_id, rc.content
-        FROM readme_contents rc
-        WHERE rc.content IS NOT NULL
-          AND EXISTS (
-              SELECT 1 FROM repo_file_trees rft
-              WHERE rft.project_id = rc.project_id
-          )
-          AND NOT EXISTS (
-              SELECT 1 FROM llm_evaluations le
-              WHERE le.project_id = rc.project_id
-                AND le.prompt_version = ?
-          )
-        ORDER BY rc.project_id
-        """,
-        (prompt_version,),
-    ).fetchall()
-
-    if not candidates:
-        logger.info("No candidates for batch preparation")
-        conn.close()
-        return _BATCH_DIR / "gemini_batch_input.jsonl"
-
-    _BATCH_DIR.mkdir(parents=True, exist_ok=True)
+    fragments = _split_user_template(user_template)
     output_path = _BATCH_DIR / "gemini_batch_input.jsonl"
+    tmp_path = output_path.with_suffix(".jsonl.tmp")
+    _BATCH_DIR.mkdir(parents=True, exist_ok=True)
 
+    head, middle, tail = _batch_request_template(system_prompt)
     count = 0
-    with open(output_path, "wb") as f:
-        for row in candidates:
-            project_id = row[0]
-            readme_content = row[1]
-
-            tree_rows = conn.execute(
-                """\
-                SELECT file_path, file_type, size_bytes
-                FROM repo_file_trees
-                WHERE project_id = ?
-                ORDER BY file_path
-                """,
-                (project_id,),
-            ).fetchall()
-
-            tree_entries = [
-                (r[0], r[1], r[2]) for r in tree_rows
-            ]
-            tree_text = format_directory_tree(tree_entries)
-            user_prompt = _build_user_prompt(
-                user_template, readme_content, tree_text
-            )
+    conn = open_connection(db_path)
+    conn.execute("PRAGMA query_only = ON")
+    try:
+        with open(tmp_path, "wb", buffering=_WRITE_BUFFER_BYTES) as f:
+            for project_id, readme_content, tree_entries in _iter_candidates(
+                conn, prompt_version,
+            ):
+                tree_text = format_directory_tree(tree_entries, presorted=True)
+                user_prompt = _build_user_prompt(
+                    fragments, readme_content, tree_text
+                )
 
-            request = {
-                "key": f"project_{project_id}",
-                "request": {
-                    "system_instruction": {
-                        "parts": [{"text": system_prompt}],
-                    },
-                    "contents": [
-                        {
-                            "role": "user",
-                            "parts": [{"text": user_prompt}],
-                        },
-                    ],
-                    "generation_config": {
-                        "temperature": 0,
-                        "max_output_tokens": _MAX_OUTPUT_TOKENS,
-                    },
-                },
-            }
-            f.write(orjson.dumps(request) + b"\n")
-            count += 1
+                f.write(head)
+                f.write(orjson.dumps(f"{_KEY_PREFIX}{project_id}"))
+                f.write(middle)
+                f.write(orjson.dumps(user_prompt))
+                f.write(tail)
+                count += 1
+    finally:
+        conn.close()
+
+    if not count:
+        tmp_path.unlink()
+        logger.info("No candidates for batch preparation")
+        return output_path
 
-    conn.close()
+    tmp_path.replace(output_path)
     logger.info(
         "Prepared %d requests in %s", count, output_path
     )
@@ -831,31 +1043,67 @@ def prepare_batch(
 # ── Phase 2: Submit (non-blocking, chunked) ─────────────────────
 
 _STATE_FILE = _BATCH_DIR / "batch_state.json"
+_DOWNLOAD_URL = (
+    "https://generativelanguage.googleapis.com/download/v1beta/"
+    "{file_name}:download"
+)
+
+
+def _iter_jsonl_lines(path: Path) -> Iterator[bytes]:
+    """Yield the non-blank lines of a JSONL file via a memory map.
+
+    Lines are sliced straight out of the mapping at ``\n`` offsets,
+    so no line-buffer object is built per record and resident memory
+    stays bounded by the page cache rather than the file size.
+
+    Args:
+        path: Path to the JSONL file.
+
+    Yields:
+        Each line's bytes without the trailing ``\n`` (or ``\r\n``).
+    """
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = mm.find(b"\n", start)
+                if end == -1:
+                    end = size
+                stop = end
+                if stop > start and mm[stop - 1] == 0x0D:
+                    stop -= 1
+                if stop > start:
+                    yield mm[start:stop]
+                start = end + 1
 
 
 def _estimate_request_tokens(line: bytes) -> int:
     """Estimate input token count for one JSONL request line.
 
+    Uses the serialized length minus the fixed request envelope
+    rather than parsing the line. JSON escapes and multi-byte
+    characters only inflate the estimate, which keeps chunks safely
+    under the token budget.
+
     Args:
         line: Raw JSONL line bytes.
 
     Returns:
-        Estimated token count (chars / 4).
+        Estimated token count (prompt bytes / 4).
     """
-    obj = orjson.loads(line)
-    req = obj.get("request", {})
-    sys_parts = req.get("system_instruction", {}).get("parts") or [{}]
-    contents = req.get("contents") or [{}]
-    user_parts = contents[0].get("parts") or [{}]
-    sys_text = sys_parts[0].get("text", "") if sys_parts else ""
-    user_text = user_parts[0].get("text", "") if user_parts else ""
-    return (len(sys_text) + len(user_text)) // _CHARS_PER_TOKEN
+    return max(0, len(line) - _REQUEST_ENVELOPE_BYTES) // _CHARS_PER_TOKEN
 
 
 def _split_jsonl(input_path: Path) -> list[Path]:
     """Split batch JSONL into chunks within the enqueued token budget.
 
-    Only writes chunk files that don't already exist.
+    Lines are streamed straight into the current chunk file. Only
+    writes chunk files that don't already exist; each is written to
+    a ``.tmp`` sibling and renamed once complete, so an interrupted
+    split never leaves a partial chunk behind.
 
     Args:
         input_path: Path to the full batch JSONL file.
@@ -864,32 +1112,37 @@ def _split_jsonl(input_path: Path) -> list[Path]:
         Ordered list of chunk file paths.
     """
     chunks: list[Path] = []
-    buf: list[bytes] = []
-    buf_tokens = 0
-    idx = 0
-
-    with open(input_path, "rb") as f:
-        for raw in f:
-            raw = raw.strip()
-            if not raw:
-                continue
+    out: BinaryIO | None = None
+    chunk_tokens = 0
+
+    def _finish_chunk() -> None:
+        if out is not None:
+            out.close()
+            Path(out.name).replace(chunks[-1])
+
+    try:
+        for raw in _iter_jsonl_lines(input_path):
             tokens = _estimate_request_tokens(raw)
-            if buf_tokens + tokens > _TOKEN_BUDGET and buf:
-                chunk_path = _BATCH_DIR / f"batch_chunk_{idx:03d}.jsonl"
-                if not chunk_path.exists():
-                    chunk_path.write_bytes(b"\n".join(buf) + b"\n")
+            if not chunks or chunk_tokens + tokens > _TOKEN_BUDGET:
+                _finish_chunk()
+                chunk_path = _BATCH_DIR / f"batch_chunk_{len(chunks):03d}.jsonl"
                 chunks.append(chunk_path)
-                idx += 1
-                buf = []
-                buf_tokens = 0
-            buf.append(raw)
-            buf_tokens += tokens
-
-    if buf:
-        chunk_path = _BATCH_DIR / f"batch_chunk_{idx:03d}.jsonl"
-        if not chunk_path.exists():
-            chunk_path.write_bytes(b"\n".join(buf) + b"\n")
-        chunks.append(chunk_path)
+                chunk_tokens = 0
+                out = None
+                if not chunk_path.exists():
+                    out = open(  # noqa: SIM115
+                        chunk_path.with_suffix(".jsonl.tmp"),
+                        "wb",
+                        buffering=_WRITE_BUFFER_BYTES,
+                    )
+            if out is not None:
+                out.write(raw)
+                out.write(b"\n")
+            chunk_tokens += tokens
+        _finish_chunk()
+    finally:
+        if out is not None:
+            out.close()
 
     logger.info("Split into %d chunks", len(chunks))
     return chunks
@@ -924,6 +1177,45 @@ def _save_state(state: dict[str, object]) -> None:
     _STATE_FILE.write_bytes(orjson.dumps(state))
 
 
+def _download_batch_output(
+    api_key: str,
+    file_name: str,
+    output_path: Path,
+) -> None:
+    """Stream a batch job's result file to disk.
+
+    Result files can be hundreds of MB, so the body is copied to
+    disk in 1 MiB pieces instead of being held in memory. Data goes
+    to a ``.tmp`` sibling that is renamed once the download
+    finishes, so an interrupted download is never mistaken for a
+    completed chunk.
+
+    Args:
+        api_key: Gemini API key.
+        file_name: Result file resource name (``files/...``).
+        output_path: Destination path for the JSONL results.
+
+    Raises:
+        httpx.HTTPStatusError: If the download request fails.
+    """
+    import httpx
+
+    tmp_path = output_path.with_suffix(".jsonl.tmp")
+    with httpx.stream(
+        "GET",
+        _DOWNLOAD_URL.format(file_name=file_name),
+        params={"alt": "media"},
+        headers={"x-goog-api-key": api_key},
+        timeout=_API_TIMEOUT_SECONDS,
+        follow_redirects=True,
+    ) as resp:
+        resp.raise_for_status()
+        with open(tmp_path, "wb", buffering=_WRITE_BUFFER_BYTES) as out:
+            for chunk in resp.iter_bytes(chunk_size=_WRITE_BUFFER_BYTES):
+                out.write(chunk)
+    tmp_path.replace(output_path)
+
+
 def submit_batch(
     input_path: Path | None = None,
 ) -> None:
@@ -934,8 +1226,10 @@ def submit_batch(
     - If no active job: splits JSONL (if needed) and submits the
       next chunk. Exits immediately after submission.
     - If active job is still running: reports status and exits.
-    - If active job succeeded: downloads results, then submits
-      the next chunk (or merges all results if all chunks done).
+    - If active job succeeded: downloads results while uploading
+      the next chunk, then submits it (or merges all results if all
+      chunks done). If the download fails, the fresh upload is
+      deleted and the state is left unchanged for the next run.
     - If active job failed: logs error and advances to next chunk.
 
     Run repeatedly (manually or via cron) until all chunks are done.
@@ -976,74 +1270,107 @@ def submit_batch(
     active_job: str | None = state.get("job_name")  # type: ignore[assignment]
     active_idx: int = state.get("chunk_idx", 0)  # type: ignore[assignment]
 
-    if active_job:
-        batch_job = client.batches.get(name=active_job)
-        job_state = ""
-        if batch_job.state is not None:
-            job_state = batch_job.state.name
-
-        if job_state not in _COMPLETED_STATES:
-            print(
-                f"[Chunk {active_idx}/{len(chunks)}] "
-                f"Job {active_job} is {job_state}. "
-                f"Run submit again later."
-            )
-            return
+    # A finished chunk's results download on this thread while the
+    # next chunk uploads; the next job is only created (and the state
+    # advanced) once the download has landed.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as downloader:
+        download: concurrent.futures.Future[None] | None = None
+        download_msg = ""
 
-        # Job finished -- handle result
-        if job_state == "JOB_STATE_SUCCEEDED":
-            output_path = _BATCH_DIR / f"batch_output_{active_idx:03d}.jsonl"
-            if batch_job.dest and batch_job.dest.file_name:
-                logger.info(
-                    "[Chunk %d] Downloading results", active_idx,
-                )
-                content = client.files.download(
-                    file=batch_job.dest.file_name,
-                )
-                output_path.write_bytes(content)
+        if active_job:
+            batch_job = client.batches.get(name=active_job)
+            job_state = ""
+            if batch_job.state is not None:
+                job_state = batch_job.state.name
+
+            if job_state not in _COMPLETED_STATES:
                 print(
                     f"[Chunk {active_idx}/{len(chunks)}] "
-                    f"Complete. Saved to {output_path.name}"
+                    f"Job {active_job} is {job_state}. "
+                    f"Run submit again later."
                 )
+                return
+
+            # Job finished -- handle result
+            if job_state == "JOB_STATE_SUCCEEDED":
+                output_path = _BATCH_DIR / f"batch_output_{active_idx:03d}.jsonl"
+                if batch_job.dest and batch_job.dest.file_name:
+                    logger.info(
+                        "[Chunk %d] Downloading results", active_idx,
+                    )
+                    download = downloader.submit(
+                        _download_batch_output,
+                        api_key, batch_job.dest.file_name, output_path,
+                    )
+                    download_msg = (
+                        f"[Chunk {active_idx}/{len(chunks)}] "
+                        f"Complete. Saved to {output_path.name}"
+                    )
+                else:
+                    logger.error(
+                        "[Chunk %d] Succeeded but no output file",
+                        active_idx,
+                    )
             else:
                 logger.error(
-                    "[Chunk %d] Succeeded but no output file",
-                    active_idx,
+                    "[Chunk %d] Job ended with: %s", active_idx, job_state,
                 )
-        else:
-            logger.error(
-                "[Chunk %d] Job ended with: %s", active_idx, job_state,
-            )
-
-        active_idx += 1
-        active_job = None
 
-    # Find next chunk to submit (skip already-downloaded)
-    while active_idx < len(chunks):
-        output_path = _BATCH_DIR / f"batch_output_{active_idx:03d}.jsonl"
-        if output_path.exists() and output_path.stat().st_size > 0:
             active_idx += 1
-            continue
-        break
+            active_job = None
+
+        # Find next chunk to submit (skip already-downloaded), from one
+        # directory listing rather than a stat per chunk
+        with os.scandir(_BATCH_DIR) as entries:
+            downloaded = {
+                entry.name for entry in entries
+                if entry.name.startswith("batch_output_")
+                and entry.stat().st_size > 0
+            }
+        while (
+            active_idx < len(chunks)
+            and f"batch_output_{active_idx:03d}.jsonl" in downloaded
+        ):
+            active_idx += 1
 
-    if active_idx >= len(chunks):
-        _merge_results(len(chunks))
-        _STATE_FILE.unlink(missing_ok=True)
-        return
+        if active_idx >= len(chunks):
+            if download is not None:
+                download.result()
+                print(download_msg)
+            _merge_results(len(chunks))
+            _STATE_FILE.unlink(missing_ok=True)
+            return
+
+        # Submit next chunk
+        chunk_path = chunks[active_idx]
+        logger.info(
+            "[Chunk %d/%d] Uploading %s",
+            active_idx, len(chunks), chunk_path.name,
+        )
+        uploaded = client.files.upload(
+            file=str(chunk_path),
+            config=types.UploadFileConfig(
+                display_name=f"osh-eval-chunk-{active_idx:03d}",
+                mime_type="jsonl",
+            ),
+        )
+        if download is not None:
+            try:
+                download.result()
+            except Exception:
+                # No state points at this upload yet; delete it so the
+                # retry's fresh upload does not leave an orphan behind.
+                if uploaded.name:
+                    try:
+                        client.files.delete(name=uploaded.name)
+                    except Exception as exc:
+                        logger.warning(
+                            "[Chunk %d] Could not delete upload %s: %s",
+                            active_idx, uploaded.name, exc,
+                        )
+                raise
+            print(download_msg)
 
-    # Submit next chunk
-    chunk_path = chunks[active_idx]
-    logger.info(
-        "[Chunk %d/%d] Uploading %s",
-        active_idx, len(chunks), chunk_path.name,
-    )
-    uploaded = client.files.upload(
-        file=str(chunk_path),
-        config=types.UploadFileConfig(
-            display_name=f"osh-eval-chunk-{active_idx:03d}",
-            mime_type="jsonl",
-        ),
-    )
     file_resource = uploaded.name
     if not file_resource:
         logger.error("[Chunk %d] Upload returned no resource name", active_idx)
@@ -1073,6 +1400,43 @@ def submit_batch(
     )
 
 
+def _append_file(out: BinaryIO, src_path: Path) -> bool:
+    """Append a file's contents to an output file.
+
+    Copies kernel-side with :func:`os.sendfile` where the platform
+    supports file-to-file transfers, falling back to a buffered
+    :func:`shutil.copyfileobj` otherwise. The data never has to be
+    held in memory as a whole.
+
+    Args:
+        out: Binary output file; its buffer is flushed first.
+        src_path: File to append.
+
+    Returns:
+        True if the appended data is empty or ends with a newline.
+    """
+    with open(src_path, "rb") as src:
+        size = os.fstat(src.fileno()).st_size
+        if size == 0:
+            return True
+        out.flush()
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(
+                    out.fileno(), src.fileno(), offset, size - offset,
+                )
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            if offset:
+                raise
+            shutil.copyfileobj(src, out, _WRITE_BUFFER_BYTES)
+        src.seek(size - 1)
+        return src.read(1) == b"\n"
+
+
 def _merge_results(total_chunks: int) -> None:
     """Merge all chunk output files into a single results JSONL.
 
@@ -1085,9 +1449,7 @@ def _merge_results(total_chunks: int) -> None:
         for i in range(total_chunks):
             chunk_output = _BATCH_DIR / f"batch_output_{i:03d}.jsonl"
             if chunk_output.exists():
-                data = chunk_output.read_bytes()
-                out.write(data)
-                if not data.endswith(b"\n"):
+                if not _append_file(out, chunk_output):
                     out.write(b"\n")
                 count += 1
     print(
@@ -1100,6 +1462,52 @@ def _merge_results(total_chunks: int) -> None:
 # ── Phase 3: Ingest ──────────────────────────────────────────────
 
 
+# Path from a batch result record to the first candidate's text.
+_RESPONSE_TEXT_PATH: tuple[str | int, ...] = (
+    "response", "candidates", 0, "content", "parts", 0, "text",
+)
+
+
+def _response_text(result: dict[str, object]) -> str | None:
+    """Return the response text of one batch result record.
+
+    Walks :data:`_RESPONSE_TEXT_PATH` with direct subscripts; a
+    missing key, empty list or wrongly typed node ends the walk
+    instead of being papered over with ``{}``/``[]`` defaults.
+
+    Args:
+        result: Decoded batch result record.
+
+    Returns:
+        The text string, or None if the record has none.
+    """
+    node: object = result
+    try:
+        for step in _RESPONSE_TEXT_PATH:
+            node = node[step]  # type: ignore[index]
+    except (LookupError, TypeError):
+        return None
+    return node if isinstance(node, str) else None
+
+
+def _open_ingest_connection(db_path: Path) -> sqlite3.Connection:
+    """Open the database connection used to write batch results.
+
+    Bulk upserts touch the whole ``llm_evaluations`` B-tree, so on
+    top of the :func:`open_connection` pragmas this connection gets a
+    256 MB page cache.
+
+    Args:
+        db_path: Path to the SQLite database file.
+
+    Returns:
+        A configured ``sqlite3.Connection``.
+    """
+    conn = open_connection(db_path)
+    conn.execute(f"PRAGMA cache_size = -{_INGEST_CACHE_KIB}")
+    return conn
+
+
 def ingest_batch_results(
     db_path: Path = DB_PATH,
     results_path: Path | None = None,
@@ -1122,87 +1530,79 @@ def ingest_batch_results(
         logger.error("Results file not found: %s", results_path)
         return 0
 
-    conn = open_connection(db_path)
     now = datetime.now(UTC).isoformat()
     ingested = 0
+    # Rows are flushed with executemany every _INGEST_BATCH_SIZE records
+    # but committed once, so the whole ingest is a single transaction.
+    pending: list[tuple[int, str, dict[str, int | str | None] | None]] = []
+    write = functools.partial(
+        upsert_llm_evaluations,
+        prompt_version=prompt_version,
+        model_id=_MODEL_ID,
+        evaluated_at=now,
+    )
 
-    with open(results_path, "rb") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                result = orjson.loads(line)
-            except orjson.JSONDecodeError:
-                logger.warning("Skipping malformed JSONL line")
-                continue
-
-            if not isinstance(result, dict):
-                continue
+    # All database work runs on one writer thread, which also owns the
+    # connection, so each batch is upserted while the next is parsed.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as writer:
+        conn = writer.submit(_open_ingest_connection, db_path).result()
+        try:
+            flushed: concurrent.futures.Future[None] | None = None
+            for line in _iter_jsonl_lines(results_path):
+                try:
+                    result = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logger.warning("Skipping malformed JSONL line")
+                    continue
 
-            # Extract project ID from key
-            key = result.get("key", "")
-            if not isinstance(key, str) or not key.startswith("project_"):
-                logger.warning("Unexpected key format: %s", key)
-                continue
+                # Extract project ID from key. Non-dict records and
+                # non-string or malformed keys all fail in this block.
+                try:
+                    key = result["key"]
+                    if not key.startswith(_KEY_PREFIX):
+                        raise ValueError(key)
+                    project_id = int(key[len(_KEY_PREFIX):])
+                except (LookupError, TypeError, AttributeError, ValueError):
+                    logger.warning(
+                        "Skipping record with bad key: %.80r", line,
+                    )
+                    continue
 
-            try:
-                project_id = int(key.replace("project_", ""))
-            except ValueError:
-                logger.warning("Cannot parse project ID from key: %s", key)
-                continue
+                # Check for batch-level error (no response)
+                if "error" in result:
+                    logger.warning(
+                        "Batch error for project %d: %s",
+                        project_id,
+                        result["error"],
+                    )
+                    continue
 
-            # Check for batch-level error (no response)
-            if "error" in result:
-                logger.warning(
-                    "Batch error for project %d: %s",
-                    project_id,
-                    result["error"],
-                )
-                continue
+                raw_text = _response_text(result)
+                if raw_text is None:
+                    logger.warning(
+                        "No response text for project %d", project_id
+                    )
+                    continue
 
-            # Extract response text
-            response = result.get("response", {})
-            if not isinstance(response, dict):
-                logger.warning(
-                    "Missing response for project %d", project_id
-                )
-                continue
+                parsed = parse_response(raw_text)
+                extracted = extract_fields(parsed) if parsed else None
 
-            # Navigate Gemini response structure
-            candidates = response.get("candidates", [])
-            if not candidates or not isinstance(candidates, list):
-                logger.warning(
-                    "No candidates for project %d", project_id
-                )
-                continue
+                pending.append((project_id, raw_text, extracted))
+                ingested += 1
 
-            content = candidates[0].get("content", {})
-            parts = content.get("parts", [])
-            if not parts:
-                logger.warning(
-                    "No content parts for project %d", project_id
-                )
-                continue
+                if len(pending) >= _INGEST_BATCH_SIZE:
+                    if flushed is not None:
+                        flushed.result()
+                    flushed = writer.submit(write, conn, pending)
+                    pending = []
 
-            raw_text = parts[0].get("text", "")
-            parsed = parse_response(raw_text)
-            extracted = extract_fields(parsed) if parsed else None
-
-            upsert_llm_evaluation(
-                conn,
-                project_id,
-                prompt_version=prompt_version,
-                model_id=_MODEL_ID,
-                raw_response=raw_text,
-                evaluated_at=now,
-                extracted=extracted,
-            )
-            ingested += 1
+            if flushed is not None:
+                flushed.result()
+            writer.submit(write, conn, pending).result()
+            writer.submit(conn.commit).result()
+        finally:
+            writer.submit(conn.close).result()
 
-    conn.commit()
-    conn.close()
     logger.info("Ingested %d evaluations", ingested)
     return ingested
 
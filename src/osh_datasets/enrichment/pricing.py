@@ -6,13 +6,14 @@ from the original source (e.g. OHX, Hardware.io), only the current
 price is stored for comparison.
 """
 
+import sqlite3
 from datetime import UTC, datetime
 from pathlib import Path
 
 import orjson
 
 from osh_datasets.config import DB_PATH, RAW_DIR, get_logger
-from osh_datasets.db import open_connection, upsert_component_price
+from osh_datasets.db import transaction, upsert_component_prices
 
 logger = get_logger(__name__)
 
@@ -20,44 +21,91 @@ _NEXAR_JSON = RAW_DIR / "nexar" / "nexar_prices.json"
 _PARTSTABLE_JSON = RAW_DIR / "partstable" / "partstable_prices.json"
 _EBAY_JSON = RAW_DIR / "ebay" / "ebay_prices.json"
 
+# (bom_component_id, matched_mpn, distributor, unit_price, currency,
+#  quantity_break, price_date, price_source)
+_PriceRow = tuple[int, str | None, str, float, str, int, str, str]
 
-def enrich_from_nexar(
-    db_path: Path = DB_PATH,
-    json_path: Path | None = None,
-) -> int:
-    """Load Nexar pricing JSON into the component_prices table.
+
+def _as_float(value: object) -> float | None:
+    """Coerce a JSON number or numeric string to float.
 
     Args:
-        db_path: Path to the SQLite database.
-        json_path: Path to scraped JSON file. Defaults to
-            ``data/raw/nexar/nexar_prices.json``.
+        value: Raw ``unit_price`` value from a scraped record.
 
     Returns:
-        Number of price records upserted.
+        The price, or None if missing or not numeric.
     """
-    if json_path is None:
-        json_path = _NEXAR_JSON
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _read_records(json_path: Path, label: str) -> list[dict[str, object]]:
+    """Read a scraper's JSON array, or return ``[]`` if missing or empty.
+
+    Args:
+        json_path: Path to scraped JSON file.
+        label: Source name for log messages.
 
+    Returns:
+        Raw pricing records.
+    """
     if not json_path.exists():
-        logger.warning("No Nexar pricing file at %s", json_path)
-        return 0
+        logger.warning("No %s pricing file at %s", label, json_path)
+        return []
 
     with open(json_path, "rb") as fh:
         records: list[dict[str, object]] = orjson.loads(fh.read())
 
     if not records:
-        logger.info("Nexar pricing file is empty")
-        return 0
+        logger.info("%s pricing file is empty", label)
+    return records
+
+
+def _store_rows(
+    conn: sqlite3.Connection,
+    rows: list[_PriceRow],
+    label: str,
+) -> int:
+    """Upsert one source's rows on an open connection.
+
+    Args:
+        conn: Active database connection.
+        rows: Validated rows from one pricing source.
+        label: Source name for log messages.
+
+    Returns:
+        Number of price records upserted.
+    """
+    upsert_component_prices(conn, rows)
+    if rows:
+        logger.info("Upserted %d price records from %s", len(rows), label)
+    return len(rows)
+
 
-    conn = open_connection(db_path)
-    count = 0
+def _nexar_rows(json_path: Path) -> list[_PriceRow]:
+    """Read Nexar pricing JSON into component price rows.
+
+    Args:
+        json_path: Path to scraped JSON file.
+
+    Returns:
+        Validated rows for :func:`upsert_component_prices`.
+    """
+    records = _read_records(json_path, "Nexar")
+    rows: list[_PriceRow] = []
 
     for record in records:
         bom_id = record.get("bom_component_id")
         if not isinstance(bom_id, int):
             continue
 
-        unit_price = record.get("unit_price")
+        unit_price = _as_float(record.get("unit_price"))
         if unit_price is None:
             continue
 
@@ -71,26 +119,40 @@ def enrich_from_nexar(
         matched_mpn = str(mpn) if mpn else None
 
         qty_break = record.get("quantity_break")
-        quantity_break = int(str(qty_break)) if qty_break is not None else 1
+        if qty_break is None:
+            quantity_break = 1
+        elif isinstance(qty_break, int):
+            quantity_break = qty_break
+        else:
+            quantity_break = int(str(qty_break))
+
+        rows.append((
+            bom_id, matched_mpn, distributor, unit_price,
+            currency, quantity_break, price_date, "nexar",
+        ))
 
-        upsert_component_price(
-            conn,
-            bom_id,
-            matched_mpn=matched_mpn,
-            distributor=distributor,
-            unit_price=float(str(unit_price)),
-            currency=currency,
-            quantity_break=quantity_break,
-            price_date=price_date,
-            price_source="nexar",
-        )
-        count += 1
+    return rows
 
-    conn.commit()
-    conn.close()
 
-    logger.info("Upserted %d price records from Nexar", count)
-    return count
+def enrich_from_nexar(
+    db_path: Path = DB_PATH,
+    json_path: Path | None = None,
+) -> int:
+    """Load Nexar pricing JSON into the component_prices table.
+
+    Args:
+        db_path: Path to the SQLite database.
+        json_path: Path to scraped JSON file. Defaults to
+            ``data/raw/nexar/nexar_prices.json``.
+
+    Returns:
+        Number of price records upserted.
+    """
+    rows = _nexar_rows(json_path or _NEXAR_JSON)
+    if not rows:
+        return 0
+    with transaction(db_path) as conn:
+        return _store_rows(conn, rows, "Nexar")
 
 
 def _parse_partstable_price(
@@ -121,37 +183,18 @@ def _parse_partstable_price(
         return None
 
 
-def enrich_from_partstable(
-    db_path: Path = DB_PATH,
-    json_path: Path | None = None,
-) -> int:
-    """Load PartsTable pricing JSON into the component_prices table.
+def _partstable_rows(json_path: Path) -> list[_PriceRow]:
+    """Read PartsTable pricing JSON into component price rows.
 
     Args:
-        db_path: Path to the SQLite database.
-        json_path: Path to scraped JSON file. Defaults to
-            ``data/raw/partstable/partstable_prices.json``.
+        json_path: Path to scraped JSON file.
 
     Returns:
-        Number of price records upserted.
+        Validated rows for :func:`upsert_component_prices`.
     """
-    if json_path is None:
-        json_path = _PARTSTABLE_JSON
-
-    if not json_path.exists():
-        logger.warning("No PartsTable pricing file at %s", json_path)
-        return 0
-
-    with open(json_path, "rb") as fh:
-        records: list[dict[str, object]] = orjson.loads(fh.read())
-
-    if not records:
-        logger.info("PartsTable pricing file is empty")
-        return 0
-
+    records = _read_records(json_path, "PartsTable")
     today = datetime.now(tz=UTC).strftime("%Y-%m-%d")
-    conn = open_connection(db_path)
-    count = 0
+    rows: list[_PriceRow] = []
 
     for record in records:
         bom_id = record.get("bom_component_id")
@@ -170,125 +213,112 @@ def enrich_from_partstable(
             if not isinstance(text, str):
                 continue
 
-            # Try to parse structured JSON from content text
+            # Try to parse structured JSON from content text; prose
+            # blocks are skipped without paying for a failed parse.
+            text = text.lstrip()
+            if not text.startswith(("{", "[")):
+                continue
             try:
-                parsed: object = orjson.loads(text.encode())
-            except (orjson.JSONDecodeError, ValueError):
+                parsed: object = orjson.loads(text)
+            except orjson.JSONDecodeError:
                 continue
 
             if not isinstance(parsed, dict):
                 if isinstance(parsed, list):
                     for item in parsed:
                         if isinstance(item, dict):
-                            count += _store_partstable_item(
-                                conn, bom_id, item, today,
-                            )
+                            row = _partstable_row(bom_id, item, today)
+                            if row is not None:
+                                rows.append(row)
                 continue
 
-            count += _store_partstable_item(
-                conn, bom_id, parsed, today,
-            )
+            row = _partstable_row(bom_id, parsed, today)
+            if row is not None:
+                rows.append(row)
 
-    conn.commit()
-    conn.close()
+    return rows
 
-    logger.info("Upserted %d price records from PartsTable", count)
-    return count
 
+def enrich_from_partstable(
+    db_path: Path = DB_PATH,
+    json_path: Path | None = None,
+) -> int:
+    """Load PartsTable pricing JSON into the component_prices table.
 
-def _store_partstable_item(
-    conn: object,
+    Args:
+        db_path: Path to the SQLite database.
+        json_path: Path to scraped JSON file. Defaults to
+            ``data/raw/partstable/partstable_prices.json``.
+
+    Returns:
+        Number of price records upserted.
+    """
+    rows = _partstable_rows(json_path or _PARTSTABLE_JSON)
+    if not rows:
+        return 0
+    with transaction(db_path) as conn:
+        return _store_rows(conn, rows, "PartsTable")
+
+
+def _partstable_row(
     bom_id: int,
     item: dict[str, object],
     today: str,
-) -> int:
-    """Store a single PartsTable result as a component price.
+) -> _PriceRow | None:
+    """Build the component price row for a single PartsTable result.
 
     Args:
-        conn: Active database connection.
         bom_id: The bom_components.id.
         item: Parsed result dict from PartsTable.
         today: Current date string.
 
     Returns:
-        1 if stored, 0 if skipped.
+        Row for :func:`upsert_component_prices`, or None if skipped.
     """
-    import sqlite3
-
-    if not isinstance(conn, sqlite3.Connection):
-        return 0
-
     price_val = item.get("price") or item.get("unitPrice")
     if price_val is None:
-        return 0
+        return None
 
     if isinstance(price_val, str):
         parsed_price = _parse_partstable_price(price_val)
         if parsed_price is None:
-            return 0
+            return None
         unit_price, currency = parsed_price
     elif isinstance(price_val, (int, float)):
         unit_price = float(price_val)
         currency = str(item.get("currency", "USD"))
     else:
-        return 0
+        return None
 
     mpn = item.get("mpn") or item.get("partNumber")
     matched_mpn = str(mpn) if mpn else None
 
     distributor = item.get("distributor") or item.get("vendor") or ""
 
-    upsert_component_price(
-        conn,
-        bom_id,
-        matched_mpn=matched_mpn,
-        distributor=str(distributor),
-        unit_price=unit_price,
-        currency=currency,
-        quantity_break=1,
-        price_date=today,
-        price_source="partstable",
+    return (
+        bom_id, matched_mpn, str(distributor), unit_price,
+        currency, 1, today, "partstable",
     )
-    return 1
 
 
-def enrich_from_ebay(
-    db_path: Path = DB_PATH,
-    json_path: Path | None = None,
-) -> int:
-    """Load eBay pricing JSON into the component_prices table.
+def _ebay_rows(json_path: Path) -> list[_PriceRow]:
+    """Read eBay pricing JSON into component price rows.
 
     Args:
-        db_path: Path to the SQLite database.
-        json_path: Path to scraped JSON file. Defaults to
-            ``data/raw/ebay/ebay_prices.json``.
+        json_path: Path to scraped JSON file.
 
     Returns:
-        Number of price records upserted.
+        Validated rows for :func:`upsert_component_prices`.
     """
-    if json_path is None:
-        json_path = _EBAY_JSON
-
-    if not json_path.exists():
-        logger.warning("No eBay pricing file at %s", json_path)
-        return 0
-
-    with open(json_path, "rb") as fh:
-        records: list[dict[str, object]] = orjson.loads(fh.read())
-
-    if not records:
-        logger.info("eBay pricing file is empty")
-        return 0
-
-    conn = open_connection(db_path)
-    count = 0
+    records = _read_records(json_path, "eBay")
+    rows: list[_PriceRow] = []
 
     for record in records:
         bom_id = record.get("bom_component_id")
         if not isinstance(bom_id, int):
             continue
 
-        unit_price = record.get("unit_price")
+        unit_price = _as_float(record.get("unit_price"))
         if unit_price is None:
             continue
 
@@ -301,39 +331,56 @@ def enrich_from_ebay(
         mpn = record.get("mpn")
         matched_mpn = str(mpn) if mpn else None
 
-        upsert_component_price(
-            conn,
-            bom_id,
-            matched_mpn=matched_mpn,
-            distributor=f"ebay:{seller}" if seller else "ebay",
-            unit_price=float(str(unit_price)),
-            currency=currency,
-            quantity_break=1,
-            price_date=price_date,
-            price_source="ebay",
-        )
-        count += 1
+        rows.append((
+            bom_id, matched_mpn,
+            f"ebay:{seller}" if seller else "ebay",
+            unit_price, currency, 1, price_date, "ebay",
+        ))
+
+    return rows
 
-    conn.commit()
-    conn.close()
 
-    logger.info("Upserted %d price records from eBay", count)
-    return count
+def enrich_from_ebay(
+    db_path: Path = DB_PATH,
+    json_path: Path | None = None,
+) -> int:
+    """Load eBay pricing JSON into the component_prices table.
+
+    Args:
+        db_path: Path to the SQLite database.
+        json_path: Path to scraped JSON file. Defaults to
+            ``data/raw/ebay/ebay_prices.json``.
+
+    Returns:
+        Number of price records upserted.
+    """
+    rows = _ebay_rows(json_path or _EBAY_JSON)
+    if not rows:
+        return 0
+    with transaction(db_path) as conn:
+        return _store_rows(conn, rows, "eBay")
 
 
 def enrich_pricing(db_path: Path = DB_PATH) -> int:
     """Run all pricing enrichment sources.
 
+    All sources are written over one connection and committed together.
+
     Args:
         db_path: Path to the SQLite database.
 
     Returns:
         Total number of price records upserted across all sources.
     """
+    sources = [
+        ("Nexar", _nexar_rows(_NEXAR_JSON)),
+        ("PartsTable", _partstable_rows(_PARTSTABLE_JSON)),
+        ("eBay", _ebay_rows(_EBAY_JSON)),
+    ]
     total = 0
-    total += enrich_from_nexar(db_path)
-    total += enrich_from_partstable(db_path)
-    total += enrich_from_ebay(db_path)
+    with transaction(db_path) as conn:
+        for label, rows in sources:
+            total += _store_rows(conn, rows, label)
     logger.info("Total pricing enrichment: %d records", total)
     return total
 
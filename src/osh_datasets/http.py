@@ -1,7 +1,9 @@
 """Shared HTTP client with retry logic and rate limiting."""
 
+import threading
 import time
 from typing import Any
+from urllib.parse import urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -13,6 +15,10 @@ logger = get_logger(__name__)
 
 DEFAULT_TIMEOUT: float = 30.0
 
+# Earliest monotonic time the next request to each host may start.
+_next_slot: dict[str, float] = {}
+_slot_lock = threading.Lock()
+
 
 def build_session(
     retries: int = 3,
@@ -42,6 +48,21 @@ def build_session(
     return session
 
 
+def _wait_for_slot(host: str, delay: float) -> None:
+    """Block until a request to *host* may start, then reserve the next slot.
+
+    Args:
+        host: Network location the request goes to.
+        delay: Minimum seconds between request starts to *host*.
+    """
+    with _slot_lock:
+        now = time.monotonic()
+        start = max(now, _next_slot.get(host, now))
+        _next_slot[host] = start + delay
+    if start > now:
+        time.sleep(start - now)
+
+
 def rate_limited_get(
     session: requests.Session,
     url: str,
@@ -49,12 +70,17 @@ def rate_limited_get(
     timeout: float = DEFAULT_TIMEOUT,
     **kwargs: Any,
 ) -> requests.Response:
-    """Perform a GET request followed by a rate-limit delay.
+    """Perform a GET request, spacing requests to the same host.
+
+    Requests to one host start at least *delay* seconds apart. Time
+    spent waiting on the previous response counts toward the delay,
+    so nothing sleeps when the server is slower than the limit. The
+    schedule is shared across sessions and threads.
 
     Args:
         session: An active ``requests.Session``.
         url: The URL to request.
-        delay: Seconds to sleep after the request completes.
+        delay: Minimum seconds between request starts to this host.
         timeout: Request timeout in seconds.
         **kwargs: Forwarded to ``session.get``.
 
@@ -64,7 +90,7 @@ def rate_limited_get(
     Raises:
         requests.HTTPError: On 4xx/5xx responses.
     """
+    _wait_for_slot(urlsplit(url).netloc, delay)
     response = session.get(url, timeout=timeout, **kwargs)
     response.raise_for_status()
-    time.sleep(delay)
     return response
@@ -6,6 +6,7 @@ OHX, and JOH into a small set of standard identifiers.  The original
 populated with the canonical form.
 """
 
+import functools
 import re
 from pathlib import Path
 
@@ -116,9 +117,22 @@ _r(r"creativecommons\.org/licen[sc]es/by", "CC-BY-4.0")
 _r(r"creative.?commons", "CC-BY-4.0")
 
 
+# Compound-license separators, tried one at a time in this order.  They
+# are not fused into one alternation: a later separator only applies
+# when an earlier one did not yield a recognized split.
+_SEPARATORS = tuple(
+    (sep, re.compile(re.escape(sep), re.IGNORECASE))
+    for sep in (";", " and ", " / ", ", ")
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize(raw: str) -> str:
     """Map a raw license string to a canonical SPDX-style identifier.
 
+    Results are memoized: the same few license strings repeat across
+    thousands of projects.
+
     Args:
         raw: The original license name string.
 
@@ -130,14 +144,10 @@ def normalize(raw: str) -> str:
         return "Other"
 
     # Detect compound licenses (multiple licenses in one string)
-    separators = [";", " and ", " / ", ", "]
-    for sep in separators:
-        if sep in text.lower():
-            parts = [
-                p.strip()
-                for p in re.split(re.escape(sep), text, flags=re.IGNORECASE)
-                if p.strip()
-            ]
+    lowered = text.lower()
+    for sep, splitter in _SEPARATORS:
+        if sep in lowered:
+            parts = [p.strip() for p in splitter.split(text) if p.strip()]
             if len(parts) >= 2:
                 normalized_parts = []
                 for part in parts:
@@ -176,17 +186,26 @@ def add_normalized_column(db_path: Path = DB_PATH) -> int:
     if "license_normalized" not in cols:
         conn.execute("ALTER TABLE licenses ADD COLUMN license_normalized TEXT")
 
-    rows = conn.execute("SELECT id, license_name FROM licenses").fetchall()
-
-    count = 0
-    for row in rows:
-        lid, raw = row[0], row[1]
-        canonical = normalize(raw)
-        conn.execute(
-            "UPDATE licenses SET license_normalized = ? WHERE id = ?",
-            (canonical, lid),
-        )
-        count += 1
+    names = [
+        r[0]
+        for r in conn.execute("SELECT DISTINCT license_name FROM licenses")
+    ]
+
+    # Normalize each distinct string once, stage the results in a temp
+    # table, and apply them with one UPDATE joined on license_name.
+    conn.execute(
+        "CREATE TEMP TABLE license_norm "
+        "(license_name TEXT PRIMARY KEY, canonical TEXT NOT NULL)"
+    )
+    conn.executemany(
+        "INSERT INTO license_norm (license_name, canonical) VALUES (?, ?)",
+        [(name, normalize(name)) for name in names],
+    )
+    count = conn.execute(
+        "UPDATE licenses SET license_normalized = n.canonical "
+        "FROM license_norm AS n WHERE n.license_name = licenses.license_name"
+    ).rowcount
+    conn.execute("DROP TABLE license_norm")
 
     conn.commit()
 
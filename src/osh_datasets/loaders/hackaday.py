@@ -4,18 +4,28 @@ import ast
 import contextlib
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
+import orjson
 import polars as pl
 
 from osh_datasets.db import (
-    insert_bom_component,
-    insert_metric,
-    insert_tags,
+    insert_bom_components,
+    insert_metrics,
+    insert_project_tags,
     transaction,
-    upsert_project,
+    upsert_projects,
 )
 from osh_datasets.loaders.base import BaseLoader
 
+# CSV columns the loader reads; the rest (body, summary, image, ...) are
+# never parsed into the frame.
+_COLUMNS = (
+    "id", "projectId", "title", "description", "url", "github_links",
+    "userName", "created", "updated", "tags", "components",
+    "viewsCount", "likesCount", "followersCount",
+)
+
 
 def _epoch_to_iso(epoch_val: object) -> str | None:
     """Convert a Unix epoch (int/float/str) to ISO 8601, or return None."""
@@ -29,18 +39,42 @@ def _epoch_to_iso(epoch_val: object) -> str | None:
 
 
 def _parse_string_list(raw: str | None) -> list[str]:
-    """Parse a Python-literal list stored as a string."""
+    """Parse a Python-literal list stored as a string.
+
+    Without double quotes or backslashes, Python's repr of a list of
+    strings is JSON once single quotes are swapped for double quotes, so
+    that common case goes through orjson. Anything else, including a
+    JSON result that is not a list of strings, falls back to
+    ``ast.literal_eval``.
+    """
     if not raw or raw.strip() in ("", "[]"):
         return []
-    try:
-        parsed = ast.literal_eval(raw)
-        if isinstance(parsed, list):
-            return [str(x).strip() for x in parsed if str(x).strip()]
-    except (ValueError, SyntaxError):
-        pass
+    parsed: object = None
+    if '"' not in raw and "\\" not in raw:
+        with contextlib.suppress(orjson.JSONDecodeError):
+            parsed = orjson.loads(raw.replace("'", '"'))
+        if not (
+            isinstance(parsed, list)
+            and all(isinstance(x, str) for x in parsed)
+        ):
+            parsed = None
+    if parsed is None:
+        try:
+            parsed = ast.literal_eval(raw)
+        except (ValueError, SyntaxError):
+            return []
+    if isinstance(parsed, list):
+        return [str(x).strip() for x in parsed if str(x).strip()]
     return []
 
 
+def _column(df: pl.DataFrame, name: str) -> list[Any]:
+    """Return a column as a list, or all None if it is absent."""
+    if name in df.columns:
+        return df.get_column(name).to_list()
+    return [None] * df.height
+
+
 class HackadayLoader(BaseLoader):
     """Load Hackaday projects from ``data/cleaned/hackaday/hackaday_cleaned.csv``."""
 
@@ -56,44 +90,74 @@ class HackadayLoader(BaseLoader):
             Number of projects loaded.
         """
         csv_path = self.data_dir / "cleaned" / "hackaday" / "hackaday_cleaned.csv"
-        df = pl.read_csv(csv_path, infer_schema_length=1000, null_values=[""])
-        count = 0
+        lf = pl.scan_csv(csv_path, infer_schema_length=1000, null_values=[""])
+        present = set(lf.collect_schema().names())
+        df = lf.select([c for c in _COLUMNS if c in present]).collect()
+
+        id_col = "id" if "id" in df.columns else "projectId"
+        source_ids = [str(v) for v in _column(df, id_col)]
+        project_rows: list[tuple[str | None, ...]] = [
+            (
+                "hackaday", source_id, title or "", description, url,
+                repo_url, None, author, None, None,
+                _epoch_to_iso(created), _epoch_to_iso(updated),
+            )
+            for source_id, title, description, url, repo_url, author,
+            created, updated in zip(
+                source_ids,
+                _column(df, "title"),
+                _column(df, "description"),
+                _column(df, "url"),
+                _column(df, "github_links"),
+                _column(df, "userName"),
+                _column(df, "created"),
+                _column(df, "updated"),
+                strict=True,
+            )
+        ]
 
         with transaction(db_path) as conn:
-            for row in df.iter_rows(named=True):
-                project_id = upsert_project(
-                    conn,
-                    source="hackaday",
-                    source_id=str(row.get("id", row.get("projectId", ""))),
-                    name=row.get("title") or "",
-                    description=row.get("description"),
-                    url=row.get("url"),
-                    repo_url=row.get("github_links"),
-                    author=row.get("userName"),
-                    created_at=_epoch_to_iso(row.get("created")),
-                    updated_at=_epoch_to_iso(row.get("updated")),
+            upsert_projects(conn, project_rows)
+            id_by_source_id: dict[str, int] = dict(
+                conn.execute(
+                    "SELECT source_id, id FROM projects WHERE source = 'hackaday'"
+                ).fetchall()
+            )
+            project_ids = [id_by_source_id[sid] for sid in source_ids]
+
+            tag_rows: list[tuple[int, str]] = []
+            for project_id, raw in zip(
+                project_ids, _column(df, "tags"), strict=True,
+            ):
+                tag_rows.extend(
+                    (project_id, tag) for tag in _parse_string_list(raw)
                 )
+            insert_project_tags(conn, tag_rows)
 
-                tags = _parse_string_list(row.get("tags"))
-                if tags:
-                    insert_tags(conn, project_id, tags)
-
-                components = _parse_string_list(row.get("components"))
-                for comp in components:
-                    insert_bom_component(
-                        conn, project_id, component_name=comp,
-                    )
-
-                for metric_name, col in [
-                    ("views", "viewsCount"),
-                    ("likes", "likesCount"),
-                    ("followers", "followersCount"),
-                ]:
-                    val = row.get(col)
+            insert_bom_components(conn, [
+                (project_id, None, comp, None, None, None, None, None)
+                for project_id, raw in zip(
+                    project_ids, _column(df, "components"), strict=True,
+                )
+                for comp in _parse_string_list(raw)
+            ])
+
+            metric_rows: list[tuple[int, str, int | None]] = []
+            for project_id, *values in zip(
+                project_ids,
+                _column(df, "viewsCount"),
+                _column(df, "likesCount"),
+                _column(df, "followersCount"),
+                strict=True,
+            ):
+                for metric_name, val in zip(
+                    ("views", "likes", "followers"), values, strict=True,
+                ):
                     if val is not None:
                         with contextlib.suppress(ValueError, TypeError):
-                            insert_metric(conn, project_id, metric_name, int(val))
-
-                count += 1
+                            metric_rows.append(
+                                (project_id, metric_name, int(val)),
+                            )
+            insert_metrics(conn, metric_rows)
 
-        return count
+        return len(project_rows)
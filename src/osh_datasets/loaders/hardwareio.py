@@ -21,15 +21,15 @@ from osh_datasets.bom_parser import (
     QTY_COLS,
     REFERENCE_COLS,
     coalesce_cols,
-    infer_quantity,
-    safe_float_str,
+    infer_quantity_expr,
+    safe_float_expr,
 )
 from osh_datasets.config import get_logger
 from osh_datasets.db import (
-    insert_bom_component,
-    insert_bom_file_path,
-    insert_license,
-    insert_metric,
+    insert_bom_components,
+    insert_bom_file_paths,
+    insert_licenses,
+    insert_metrics,
     transaction,
     upsert_project,
 )
@@ -55,6 +55,31 @@ def _build_name_lookup(
     return {str(r[1]).strip().lower(): int(r[0]) for r in rows}
 
 
+def _attach_project_ids(
+    df: pl.DataFrame,
+    name_to_id: dict[str, int],
+) -> pl.DataFrame:
+    """Add a ``project_id`` column and keep only rows that matched.
+
+    ``project_name`` is stripped and lowercased in Polars and mapped
+    through *name_to_id* with a single columnar lookup.
+
+    Args:
+        df: Frame with a ``project_name`` column.
+        name_to_id: Lookup from :func:`_build_name_lookup`.
+
+    Returns:
+        Matched rows, in their original order.
+    """
+    return df.with_columns(
+        pl.col("project_name")
+        .str.strip_chars()
+        .str.to_lowercase()
+        .replace_strict(name_to_id, default=None, return_dtype=pl.Int64)
+        .alias("project_id")
+    ).filter(pl.col("project_id").is_not_null())
+
+
 def load_hardwareio_bom(
     db_path: Path,
     bom_csv: Path,
@@ -108,32 +133,24 @@ def load_hardwareio_bom(
         logger.info("No usable BOM data after normalization")
         return 0
 
-    inserted = 0
-
     with transaction(db_path) as conn:
         name_to_id = _build_name_lookup(conn)
+        # Columns are selected in insert order so rows() yields
+        # ready-made parameter tuples.
+        matched = _attach_project_ids(normalized, name_to_id).select(
+            "project_id",
+            "reference",
+            "component_name",
+            infer_quantity_expr("reference", "quantity_raw").alias("quantity"),
+            safe_float_expr("unit_cost_raw").alias("unit_cost"),
+            "manufacturer",
+            "part_number",
+            "footprint",
+        )
+        rows = matched.rows()
+        insert_bom_components(conn, rows)
 
-        for row in normalized.iter_rows(named=True):
-            proj_name = str(row["project_name"] or "").strip().lower()
-            project_id = name_to_id.get(proj_name)
-            if project_id is None:
-                continue
-
-            insert_bom_component(
-                conn,
-                project_id,
-                reference=row["reference"],
-                component_name=row["component_name"],
-                quantity=infer_quantity(
-                    row["reference"], row["quantity_raw"],
-                ),
-                unit_cost=safe_float_str(row["unit_cost_raw"]),
-                manufacturer=row["manufacturer"],
-                part_number=row["part_number"],
-                footprint=row["footprint"],
-            )
-            inserted += 1
-
+    inserted = len(rows)
     logger.info(
         "Loaded %d BOM components from %d rows", inserted, normalized.height
     )
@@ -176,20 +193,21 @@ def _load_bom_file_paths(
     if bom_files.is_empty():
         return 0
 
-    inserted = 0
     with transaction(db_path) as conn:
         name_to_id = _build_name_lookup(conn)
-        for row in bom_files.iter_rows(named=True):
-            proj_name = str(row["project_name"] or "").strip().lower()
-            project_id = name_to_id.get(proj_name)
-            if project_id is None:
-                continue
-            file_name = str(row["file_name"] or "").strip()
-            if file_name:
-                insert_bom_file_path(conn, project_id, "", file_name)
-                inserted += 1
+        matched = (
+            _attach_project_ids(bom_files, name_to_id)
+            .select(
+                "project_id",
+                pl.lit("").alias("repo_url"),
+                pl.col("file_name").str.strip_chars(),
+            )
+            .filter(pl.col("file_name") != "")
+        )
+        rows = matched.rows()
+        insert_bom_file_paths(conn, rows)
 
-    return inserted
+    return len(rows)
 
 
 class HardwareioLoader(BaseLoader):
@@ -214,6 +232,8 @@ class HardwareioLoader(BaseLoader):
             items: list[dict[str, object]] = orjson.loads(fh.read())
 
         count = 0
+        licenses: list[tuple[int, str, str]] = []
+        metrics: list[tuple[int, str, int | None]] = []
 
         with transaction(db_path) as conn:
             for item in items:
@@ -243,8 +263,8 @@ class HardwareioLoader(BaseLoader):
 
                 lic = item.get("license")
                 if lic and str(lic).strip():
-                    insert_license(
-                        conn, project_id, "hardware", str(lic).strip()
+                    licenses.append(
+                        (project_id, "hardware", str(lic).strip())
                     )
 
                 stats = item.get("statistics")
@@ -260,19 +280,22 @@ class HardwareioLoader(BaseLoader):
                             with contextlib.suppress(
                                 ValueError, TypeError
                             ):
-                                insert_metric(
-                                    conn, project_id, metric_name, int(val)
+                                metrics.append(
+                                    (project_id, metric_name, int(val))
                                 )
 
                 views = item.get("views")
                 if views is not None:
                     with contextlib.suppress(ValueError, TypeError):
-                        insert_metric(
-                            conn, project_id, "views", int(str(views))
+                        metrics.append(
+                            (project_id, "views", int(str(views)))
                         )
 
                 count += 1
 
+            insert_licenses(conn, licenses)
+            insert_metrics(conn, metrics)
+
         # Load BOM components if CSV exists
         bom_csv = (
             self.data_dir / "cleaned" / "hardwareio"
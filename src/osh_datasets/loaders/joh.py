@@ -1,68 +1,119 @@
 """Loader for Journal of Open Hardware (JOH) CSV with OpenAlex enrichment."""
 
 import contextlib
-import csv
 import re
 from pathlib import Path
 
+import polars as pl
+
 from osh_datasets.db import (
-    insert_license,
-    insert_publication,
+    insert_licenses,
+    insert_publications,
     transaction,
-    upsert_project,
+    upsert_projects,
 )
 from osh_datasets.loaders.base import BaseLoader
 
-_URL_RE = re.compile(r"https?://[^\s,;)]+")
-
-
-def _extract_urls(text: str | None) -> list[str]:
-    """Extract all URLs from a free-text field.
+# A URL (same token rules as a plain ``https?://`` match) that mentions
+# github.com or gitlab.com anywhere, found in a single scan.
+_REPO_URL_RE = re.compile(
+    r"https?://[^\s,;)]*?(?i:github\.com|gitlab\.com)[^\s,;)]*"
+)
 
-    Args:
-        text: Free-text potentially containing embedded URLs.
 
-    Returns:
-        List of extracted URL strings.
-    """
+def _first_repo_url(text: str | None) -> str | None:
+    """Return the first GitHub/GitLab URL from free text, or None."""
     if not text:
-        return []
-    return _URL_RE.findall(text)
+        return None
+    # Cheap substring test first; most link fields have no repo URL and
+    # the regex's lazy scan is slower than this on text without one.
+    lowered = text.lower()
+    if "github.com" not in lowered and "gitlab.com" not in lowered:
+        return None
+    match = _REPO_URL_RE.search(text)
+    return match.group(0) if match else None
 
 
-def _first_repo_url(text: str | None) -> str | None:
-    """Return the first GitHub/GitLab URL from free text, or None."""
-    for url in _extract_urls(text):
-        if "github.com" in url.lower() or "gitlab.com" in url.lower():
-            return url
-    return None
+_OPENALEX_FIELDS = ("cited_by_count", "publication_year", "open_access")
 
 
 def _build_openalex_doi_index(
     csv_path: Path,
-) -> dict[str, dict[str, str]]:
+) -> dict[str, dict[str, str | None]]:
     """Index OpenAlex JOH records by normalized DOI.
 
+    Only the DOI, venue and enrichment columns are parsed; the rest of
+    the (wide) OpenAlex export is skipped by the Polars reader.
+
     Args:
         csv_path: Path to ``openalex_metadata.csv``.
 
     Returns:
-        Mapping from DOI to OpenAlex record dict.
+        Mapping from DOI to a dict of the ``_OPENALEX_FIELDS`` values.
     """
-    index: dict[str, dict[str, str]] = {}
     if not csv_path.exists():
-        return index
-    with open(csv_path, newline="") as fh:
-        reader = csv.DictReader(fh)
-        for row in reader:
-            loc = row.get("primary_location", "")
-            if "journal of open hardware" not in loc.lower():
-                continue
-            doi_raw = row.get("doi", "")
-            doi = doi_raw.replace("https://doi.org/", "").strip().lower()
-            if doi:
-                index[doi] = row
-    return index
+        return {}
+    lf = pl.scan_csv(csv_path, infer_schema_length=0)
+    present = set(lf.collect_schema().names())
+    if "doi" not in present or "primary_location" not in present:
+        return {}
+
+    df = (
+        lf.filter(
+            pl.col("primary_location")
+            .str.to_lowercase()
+            .str.contains("journal of open hardware", literal=True)
+        )
+        .select(
+            pl.col("doi")
+            .str.replace_all("https://doi.org/", "", literal=True)
+            .str.strip_chars()
+            .str.to_lowercase(),
+            *(
+                pl.col(c) if c in present else pl.lit(None, pl.String).alias(c)
+                for c in _OPENALEX_FIELDS
+            ),
+        )
+        .filter(pl.col("doi") != "")
+        .collect()
+    )
+    return {row["doi"]: row for row in df.iter_rows(named=True)}
+
+
+_LICENSE_COLUMNS = (
+    ("hardware", "HW_License"),
+    ("software", "SW_License"),
+    ("documentation", "Documentation_License"),
+)
+
+
+def _column(present: set[str], name: str) -> pl.Expr:
+    """Select column *name*, or a null column if the CSV lacks it.
+
+    Args:
+        present: Column names in the JOH CSV.
+        name: Column to select.
+
+    Returns:
+        A string expression aliased to *name*.
+    """
+    if name in present:
+        return pl.col(name)
+    return pl.lit(None, pl.String).alias(name)
+
+
+def _stripped(present: set[str], name: str) -> pl.Expr:
+    """Select column *name* stripped of whitespace, with ``""`` as null.
+
+    Args:
+        present: Column names in the JOH CSV.
+        name: Column to select.
+
+    Returns:
+        A string expression aliased to *name*.
+    """
+    value = _column(present, name).str.strip_chars()
+    return pl.when(value != "").then(value).alias(name)
 
 
 class JohLoader(BaseLoader):
@@ -89,69 +140,82 @@ class JohLoader(BaseLoader):
         )
         oa_index = _build_openalex_doi_index(oa_csv)
 
-        count = 0
-
-        with transaction(db_path) as conn, open(joh_path, newline="") as fh:
-            reader = csv.DictReader(fh)
-            for row in reader:
-                title = (row.get("Title") or "").strip()
-                if not title:
-                    continue
-
-                doi = (row.get("DOI") or "").strip().lower()
-                repo_links = row.get("Repository Links") or ""
-                other_links = row.get("Other Links") or ""
-
-                project_id = upsert_project(
-                    conn,
-                    source="joh",
-                    source_id=doi or title,
-                    name=title,
-                    description=(row.get("Abstract Note") or "").strip() or None,
-                    url=(row.get("Url") or "").strip() or None,
-                    repo_url=_first_repo_url(repo_links + " " + other_links),
-                    author=(row.get("Author") or "").strip() or None,
-                    created_at=(row.get("Date") or "").strip() or None,
-                )
-
-                for ltype, col in [
-                    ("hardware", "HW_License"),
-                    ("software", "SW_License"),
-                    ("documentation", "Documentation_License"),
-                ]:
-                    val = (row.get(col) or "").strip()
+        df = pl.read_csv(joh_path, infer_schema_length=0)
+        present = set(df.columns)
+        df = df.select(
+            _stripped(present, "Title"),
+            _stripped(present, "DOI").str.to_lowercase(),
+            _stripped(present, "Abstract Note"),
+            _stripped(present, "Url"),
+            _stripped(present, "Author"),
+            _stripped(present, "Date"),
+            _column(present, "Repository Links"),
+            _column(present, "Other Links"),
+            _column(present, "Publication Year"),
+            *(_stripped(present, col) for _, col in _LICENSE_COLUMNS),
+        ).filter(pl.col("Title").is_not_null())
+
+        project_rows: list[tuple[str | None, ...]] = []
+        for (
+            title, doi, description, url, author, date,
+            repo_links, other_links, *_rest,
+        ) in df.iter_rows():
+            project_rows.append((
+                "joh", doi or title, title, description, url,
+                _first_repo_url(f"{repo_links or ''} {other_links or ''}"),
+                None, author, None, None, date, None,
+            ))
+
+        license_rows: list[tuple[int, str, str]] = []
+        publication_rows: list[
+            tuple[int, str | None, str | None, int | None, str | None,
+                  int | None, int | None]
+        ] = []
+
+        with transaction(db_path) as conn:
+            upsert_projects(conn, project_rows)
+            id_by_source_id: dict[str, int] = dict(
+                conn.execute(
+                    "SELECT source_id, id FROM projects WHERE source = 'joh'"
+                ).fetchall()
+            )
+
+            for project_row, (
+                title, doi, *_fields, year_raw, hw, sw, docs,
+            ) in zip(project_rows, df.iter_rows(), strict=True):
+                project_id = id_by_source_id[str(project_row[1])]
+
+                for (ltype, _), val in zip(
+                    _LICENSE_COLUMNS, (hw, sw, docs), strict=True,
+                ):
                     if val:
-                        insert_license(conn, project_id, ltype, val)
+                        license_rows.append((project_id, ltype, val))
 
                 # Enrich with OpenAlex
-                oa_row = oa_index.get(doi)
+                oa_row = oa_index.get(doi or "")
                 cited_by: int | None = None
                 pub_year: int | None = None
-                open_access: bool | None = None
+                open_access: int | None = None
 
                 if oa_row:
                     with contextlib.suppress(ValueError, TypeError):
-                        cited_by = int(oa_row.get("cited_by_count", ""))
+                        cited_by = int(oa_row["cited_by_count"] or "")
                     with contextlib.suppress(ValueError, TypeError):
-                        pub_year = int(oa_row.get("publication_year", ""))
-                    oa_str = oa_row.get("open_access", "")
-                    open_access = "true" in oa_str.lower() if oa_str else None
+                        pub_year = int(oa_row["publication_year"] or "")
+                    oa_str = oa_row["open_access"]
+                    if oa_str:
+                        open_access = int("true" in oa_str.lower())
 
                 if not pub_year:
                     with contextlib.suppress(ValueError, TypeError):
-                        pub_year = int(row.get("Publication Year", ""))
-
-                insert_publication(
-                    conn,
-                    project_id,
-                    doi=doi or None,
-                    title=title,
-                    publication_year=pub_year,
-                    journal="Journal of Open Hardware",
-                    cited_by_count=cited_by,
-                    open_access=open_access,
-                )
-
-                count += 1
-
-        return count
+                        pub_year = int(year_raw or "")
+
+                publication_rows.append((
+                    project_id, doi, title, pub_year,
+                    "Journal of Open Hardware", cited_by, open_access,
+                ))
+
+            insert_licenses(conn, license_rows)
+            insert_publications(conn, publication_rows)
+
+        return len(project_rows)
@@ -9,8 +9,10 @@ import pytest
 from osh_datasets.bom_parser import (
     coalesce_cols,
     infer_quantity,
+    infer_quantity_expr,
     normalize_bom_df,
     parse_bom_file,
+    safe_float_expr,
     safe_float_str,
     safe_int_str,
 )
@@ -112,6 +114,50 @@ class TestInferQuantity:
         assert infer_quantity("R1, R2, R3", "4") == 4
 
 
+_RAW_NUMBERS = [
+    None, "", "  ", "5", " 5 ", "2.5", "-3", "1,000", "$4.20",
+    " $ 1 , 2 ", "1e3", "N/A", "1.2.3", "$", ",", "7\t8",
+]
+_REFERENCES = [
+    None, "", " ", "R1", "R1,R2", "R1, R2, R3", ",", " , ", "R1,",
+    "R1,,R2", "R1;R2",
+]
+
+
+class TestColumnarEquivalents:
+    """The Polars expressions match the per-value parsers."""
+
+    def test_safe_float_expr(self) -> None:
+        """safe_float_expr agrees with safe_float_str."""
+        df = pl.DataFrame({"raw": _RAW_NUMBERS}, schema={"raw": pl.String})
+        got = df.select(safe_float_expr("raw"))["raw"].to_list()
+        assert got == [safe_float_str(v) for v in _RAW_NUMBERS]
+
+    def test_infer_quantity_expr(self) -> None:
+        """infer_quantity_expr agrees with infer_quantity."""
+        pairs = [(r, q) for r in _REFERENCES for q in _RAW_NUMBERS]
+        df = pl.DataFrame(
+            {"ref": [r for r, _ in pairs], "qty": [q for _, q in pairs]},
+            schema={"ref": pl.String, "qty": pl.String},
+        )
+        got = df.select(
+            infer_quantity_expr("ref", "qty").alias("q"),
+        )["q"].to_list()
+        assert got == [infer_quantity(r, q) for r, q in pairs]
+
+    def test_null_columns(self) -> None:
+        """Absent (null-literal) columns yield nulls, not errors."""
+        df = pl.DataFrame({"x": [1, 2]}).with_columns(
+            pl.lit(None).alias("ref"), pl.lit(None).alias("qty"),
+        )
+        out = df.select(
+            infer_quantity_expr("ref", "qty").alias("q"),
+            safe_float_expr("qty").alias("c"),
+        )
+        assert out["q"].to_list() == [None, None]
+        assert out["c"].to_list() == [None, None]
+
+
 class TestCoalesceCols:
     """Tests for coalesce_cols expression builder."""
 
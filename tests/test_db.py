@@ -7,16 +7,24 @@ import pytest
 from osh_datasets.db import (
     init_db,
     insert_bom_component,
+    insert_bom_components,
     insert_bom_file_path,
+    insert_bom_file_paths,
     insert_contributor,
     insert_license,
+    insert_licenses,
     insert_metric,
+    insert_metrics,
+    insert_project_tags,
     insert_publication,
     insert_tags,
     open_connection,
     sanitize_part_number,
     transaction,
+    upsert_llm_evaluation,
+    upsert_llm_evaluations,
     upsert_project,
+    upsert_projects,
     upsert_repo_metrics,
 )
 
@@ -114,6 +122,28 @@ class TestUpsertProject:
             pid2 = upsert_project(conn, source="src", source_id="x", name="A")
         assert pid1 == pid2
 
+    def test_batch_upsert_preserves_existing(self, db_path: Path) -> None:
+        """Batched upsert follows the same COALESCE rules."""
+        with transaction(db_path) as conn:
+            pid = upsert_project(
+                conn, source="t", source_id="1", name="A", url="u1",
+            )
+            upsert_projects(conn, [
+                ("t", "1", "A", "desc", None, None, None,
+                 None, None, None, None, None),
+                ("t", "2", "B", None, "u2", None, None,
+                 None, None, None, None, None),
+            ])
+        conn = open_connection(db_path)
+        rows = conn.execute(
+            "SELECT id, source_id, description, url FROM projects ORDER BY id"
+        ).fetchall()
+        conn.close()
+        assert [tuple(r) for r in rows] == [
+            (pid, "1", "desc", "u1"),
+            (pid + 1, "2", None, "u2"),
+        ]
+
 
 class TestRelatedTables:
     """Tests for tags, licenses, metrics, BOM, publications, contributors."""
@@ -145,6 +175,25 @@ class TestRelatedTables:
         assert row[0] == "hardware"
         assert row[1] == "MIT"
 
+    def test_insert_licenses_skips_duplicates(self, db_path: Path) -> None:
+        """Batch license insert ignores repeated rows."""
+        with transaction(db_path) as conn:
+            pid = upsert_project(conn, source="t", source_id="1", name="P")
+            insert_licenses(conn, [
+                (pid, "hardware", "MIT"),
+                (pid, "software", "GPL-3.0"),
+                (pid, "hardware", "MIT"),
+            ])
+        conn = open_connection(db_path)
+        rows = conn.execute(
+            "SELECT license_type, license_name FROM licenses ORDER BY id"
+        ).fetchall()
+        conn.close()
+        assert [tuple(r) for r in rows] == [
+            ("hardware", "MIT"),
+            ("software", "GPL-3.0"),
+        ]
+
     def test_insert_metric_upsert(self, db_path: Path) -> None:
         """Metric upsert overwrites on conflict."""
         with transaction(db_path) as conn:
@@ -338,6 +387,74 @@ class TestRelatedTables:
             "pcb/BOM_v2.xlsx",
         ]
 
+    def test_batch_tags_metrics_bom(self, db_path: Path) -> None:
+        """Batched related-table helpers match the single-row ones."""
+        with transaction(db_path) as conn:
+            pid_a = upsert_project(conn, source="t", source_id="1", name="A")
+            pid_b = upsert_project(conn, source="t", source_id="2", name="B")
+            insert_project_tags(conn, [(pid_a, "x"), (pid_b, "x"), (pid_a, "x")])
+            insert_metrics(conn, [
+                (pid_a, "views", 1), (pid_b, "views", 2), (pid_a, "views", 3),
+            ])
+            insert_bom_components(conn, [
+                (pid_a, "R1", "Resistor", 2, 0.1, None, "LM7805", None),
+                (pid_b, None, "Thing", None, None, None, "N/A", None),
+            ])
+            insert_bom_file_paths(conn, [
+                (pid_a, "", "bom.csv"), (pid_a, "", "bom.csv"),
+                (pid_b, "", "parts.xlsx"),
+            ])
+        conn = open_connection(db_path)
+        tags = conn.execute(
+            "SELECT project_id, tag FROM tags ORDER BY project_id"
+        ).fetchall()
+        metrics = conn.execute(
+            "SELECT project_id, metric_value FROM metrics ORDER BY project_id"
+        ).fetchall()
+        parts = conn.execute(
+            "SELECT project_id, part_number FROM bom_components ORDER BY id"
+        ).fetchall()
+        paths = conn.execute(
+            "SELECT project_id, file_path FROM bom_file_paths ORDER BY id"
+        ).fetchall()
+        conn.close()
+        assert [tuple(r) for r in tags] == [(pid_a, "x"), (pid_b, "x")]
+        assert [tuple(r) for r in metrics] == [(pid_a, 3), (pid_b, 2)]
+        assert [tuple(r) for r in parts] == [(pid_a, "LM7805"), (pid_b, None)]
+        assert [tuple(r) for r in paths] == [
+            (pid_a, "bom.csv"), (pid_b, "parts.xlsx"),
+        ]
+
+    def test_upsert_llm_evaluations_batch(self, db_path: Path) -> None:
+        """Batched LLM evaluation upsert matches the single-row helper."""
+        with transaction(db_path) as conn:
+            pid_a = upsert_project(conn, source="t", source_id="1", name="A")
+            pid_b = upsert_project(conn, source="t", source_id="2", name="B")
+            upsert_llm_evaluation(
+                conn, pid_a, prompt_version="v", model_id="old",
+                raw_response="{}", evaluated_at="t0",
+            )
+            upsert_llm_evaluations(
+                conn,
+                [
+                    (pid_a, '{"a": 1}', {"project_type": "hardware"}),
+                    (pid_b, '{"b": 1}', None),
+                ],
+                prompt_version="v",
+                model_id="new",
+                evaluated_at="t1",
+            )
+        conn = open_connection(db_path)
+        rows = conn.execute(
+            "SELECT project_id, model_id, raw_response, project_type, "
+            "evaluated_at FROM llm_evaluations ORDER BY project_id",
+        ).fetchall()
+        conn.close()
+        assert [tuple(r) for r in rows] == [
+            (pid_a, "new", '{"a": 1}', "hardware", "t1"),
+            (pid_b, "new", '{"b": 1}', None, "t1"),
+        ]
+
 
 class TestSanitizePartNumber:
     """Tests for part number sanitization."""
@@ -0,0 +1,49 @@
+"""Tests for the shared HTTP helpers."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from osh_datasets import http
+
+
+@pytest.fixture(autouse=True)
+def _reset_slots() -> None:
+    """Start every test with an empty per-host schedule."""
+    http._next_slot.clear()
+
+
+class TestRateLimitedGet:
+    """Tests for per-host request spacing."""
+
+    def test_first_request_does_not_sleep(self) -> None:
+        """A host's first request goes out immediately."""
+        session = MagicMock()
+        with patch.object(http.time, "sleep") as sleep:
+            resp = http.rate_limited_get(session, "https://a.example/x")
+        sleep.assert_not_called()
+        assert resp is session.get.return_value
+        resp.raise_for_status.assert_called_once()
+
+    def test_back_to_back_requests_are_spaced(self) -> None:
+        """A second request to the same host waits out the delay."""
+        session = MagicMock()
+        with (
+            patch.object(http.time, "monotonic", return_value=100.0),
+            patch.object(http.time, "sleep") as sleep,
+        ):
+            http.rate_limited_get(session, "https://a.example/1", delay=1.0)
+            http.rate_limited_get(session, "https://a.example/2", delay=1.0)
+            http.rate_limited_get(session, "https://b.example/1", delay=1.0)
+        sleep.assert_called_once_with(1.0)
+
+    def test_slow_response_counts_toward_delay(self) -> None:
+        """No sleep when the previous request took longer than the delay."""
+        session = MagicMock()
+        with (
+            patch.object(http.time, "monotonic", side_effect=[100.0, 102.0]),
+            patch.object(http.time, "sleep") as sleep,
+        ):
+            http.rate_limited_get(session, "https://a.example/1", delay=1.0)
+            http.rate_limited_get(session, "https://a.example/2", delay=1.0)
+        sleep.assert_not_called()
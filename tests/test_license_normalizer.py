@@ -0,0 +1,119 @@
+"""Tests for the license string normalizer."""
+
+from pathlib import Path
+
+import pytest
+
+from osh_datasets.db import (
+    init_db,
+    insert_license,
+    open_connection,
+    transaction,
+    upsert_project,
+)
+from osh_datasets.license_normalizer import add_normalized_column, normalize
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    """Create a temporary database and return its path."""
+    path = tmp_path / "test.db"
+    init_db(path)
+    return path
+
+
+class TestNormalize:
+    """Unit tests for the normalize() pure function."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("", "Other"),
+            ("   ", "Other"),
+            ("MIT", "MIT"),
+            ("mit license", "MIT"),
+            ("CC BY-SA 4.0", "CC-BY-SA-4.0"),
+            ("CC-BY-NC-SA", "CC-BY-NC-SA-4.0"),
+            ("cc by 3.0", "CC-BY-3.0"),
+            ("Public Domain", "CC0-1.0"),
+            ("CERN OHL v1.2", "CERN-OHL-1.2"),
+            ("CERN-OHL-S-2.0", "CERN-OHL-S-2.0"),
+            ("GNU GPL v3", "GPL-3.0-or-later"),
+            ("LGPL 3", "LGPL-3.0-or-later"),
+            ("Apache 2.0", "Apache-2.0"),
+            ("no software", "No-Software"),
+            ("something unknown", "Other"),
+        ],
+    )
+    def test_single(self, raw: str, expected: str) -> None:
+        """Single license strings map to their canonical form."""
+        assert normalize(raw) == expected
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("CERN OHL S; GPL v3", "CERN-OHL-S-2.0 + GPL-3.0-or-later"),
+            ("MIT and Apache 2.0", "Apache-2.0 + MIT"),
+            ("MIT / MIT", "MIT"),
+            ("Apache 2.0, whatever", "Apache-2.0"),
+        ],
+    )
+    def test_compound(self, raw: str, expected: str) -> None:
+        """Compound strings combine the distinct canonical parts."""
+        assert normalize(raw) == expected
+
+
+class TestAddNormalizedColumn:
+    """Tests for populating licenses.license_normalized."""
+
+    def test_populates_every_row(self, db_path: Path) -> None:
+        """Each license row receives its normalized name."""
+        with transaction(db_path) as conn:
+            p1 = upsert_project(
+                conn, source="t", source_id="1", name="A",
+            )
+            p2 = upsert_project(
+                conn, source="t", source_id="2", name="B",
+            )
+            insert_license(conn, p1, "hardware", "CERN OHL v1.2")
+            insert_license(conn, p1, "software", "GNU GPL v3")
+            insert_license(conn, p2, "hardware", "CERN OHL v1.2")
+            insert_license(conn, p2, "documentation", "cc by-sa")
+
+        assert add_normalized_column(db_path) == 4
+
+        conn = open_connection(db_path)
+        rows = conn.execute(
+            "SELECT project_id, license_type, license_normalized "
+            "FROM licenses ORDER BY id"
+        ).fetchall()
+        conn.close()
+
+        assert [tuple(r) for r in rows] == [
+            (p1, "hardware", "CERN-OHL-1.2"),
+            (p1, "software", "GPL-3.0-or-later"),
+            (p2, "hardware", "CERN-OHL-1.2"),
+            (p2, "documentation", "CC-BY-SA-4.0"),
+        ]
+
+    def test_rerun_is_idempotent(self, db_path: Path) -> None:
+        """Running twice keeps the same values and no temp tables leak."""
+        with transaction(db_path) as conn:
+            pid = upsert_project(
+                conn, source="t", source_id="1", name="A",
+            )
+            insert_license(conn, pid, "hardware", "MIT")
+
+        assert add_normalized_column(db_path) == 1
+        assert add_normalized_column(db_path) == 1
+
+        conn = open_connection(db_path)
+        value = conn.execute(
+            "SELECT license_normalized FROM licenses"
+        ).fetchone()[0]
+        conn.close()
+        assert value == "MIT"
+
+    def test_empty_table(self, db_path: Path) -> None:
+        """An empty licenses table normalizes zero rows."""
+        assert add_normalized_column(db_path) == 0
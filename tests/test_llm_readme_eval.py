@@ -1,23 +1,40 @@
 """Tests for Track 2 LLM-based README evaluation module."""
 
+import os
+import time
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import orjson
 import pytest
 
 from osh_datasets.db import init_db, open_connection
 from osh_datasets.enrichment.llm_readme_eval import (
+    _MAX_OUTPUT_TOKENS,
     _MAX_README_CHARS,
     _MAX_TREE_CHARS,
     _MAX_TREE_ENTRIES,
+    _batch_request_template,
     _build_user_prompt,
+    _call_gemini_realtime,
+    _download_batch_output,
+    _estimate_request_tokens,
+    _fetch_candidates,
+    _iter_jsonl_lines,
+    _load_prompt_template,
+    _merge_results,
+    _response_text,
+    _retry_after_seconds,
+    _split_jsonl,
+    _split_user_template,
+    _TokenBucket,
     extract_fields,
     format_directory_tree,
     ingest_batch_results,
     parse_response,
     prepare_batch,
     run_realtime,
+    submit_batch,
 )
 
 
@@ -52,6 +69,15 @@ class TestFormatDirectoryTree:
         assert lines[0] == "a_file.txt"
         assert lines[1] == "z_file.txt"
 
+    def test_presorted_keeps_order(self) -> None:
+        """Presorted input is rendered in the given order."""
+        entries = [
+            ("a_dir", "tree", None),
+            ("a_dir/file.txt", "blob", 10),
+        ]
+        result = format_directory_tree(entries, presorted=True)
+        assert result == "a_dir/\na_dir/file.txt"
+
     def test_entry_cap(self) -> None:
         """Entries beyond _MAX_TREE_ENTRIES are truncated."""
         entries = [
@@ -75,13 +101,41 @@ class TestFormatDirectoryTree:
         assert "[TREE TRUNCATED]" in result or len(result) <= _MAX_TREE_CHARS + 100
 
 
+class TestLoadPromptTemplate:
+    """Tests for prompt file loading."""
+
+    def test_reloads_after_file_change(self, tmp_path: Path) -> None:
+        """Cached templates are refreshed when the file's mtime changes."""
+        prompt = tmp_path / "revised_long_prompt.md"
+        prompt.write_text(
+            'SYSTEM_PROMPT = """sys v1"""\nUSER_PROMPT_TEMPLATE = """user"""'
+        )
+        with patch(
+            "osh_datasets.enrichment.llm_readme_eval._PROMPT_DIR", tmp_path,
+        ):
+            first = _load_prompt_template()
+            assert _load_prompt_template() is first
+
+            prompt.write_text(
+                'SYSTEM_PROMPT = """sys v2"""\nUSER_PROMPT_TEMPLATE = """user"""'
+            )
+            stat = prompt.stat()
+            os.utime(prompt, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            second = _load_prompt_template()
+
+        assert first == ("sys v1", "user")
+        assert second == ("sys v2", "user")
+
+
 class TestBuildPrompt:
     """Tests for prompt assembly."""
 
     def test_placeholders_filled(self) -> None:
         """Template placeholders are replaced."""
         template = "Tree:\n{directory_structure}\n\nREADME:\n{readme_content}"
-        result = _build_user_prompt(template, "Hello README", "file.txt")
+        result = _build_user_prompt(
+            _split_user_template(template), "Hello README", "file.txt"
+        )
         assert "{directory_structure}" not in result
         assert "{readme_content}" not in result
         assert "Hello README" in result
@@ -91,16 +145,26 @@ class TestBuildPrompt:
         """Long README is truncated with marker."""
         template = "{readme_content}"
         long_readme = "x" * (_MAX_README_CHARS + 5000)
-        result = _build_user_prompt(template, long_readme, "")
+        result = _build_user_prompt(_split_user_template(template), long_readme, "")
         assert "[README TRUNCATED]" in result
         # Content before truncation marker should be max length
         assert len(result.split("[README TRUNCATED]")[0].strip()) <= _MAX_README_CHARS
 
+    def test_schema_braces_unescaped(self) -> None:
+        """Doubled template braces collapse; inserted text is untouched."""
+        template = '{readme_content}\n{{"key": {{"nested": 1}}}}'
+        result = _build_user_prompt(
+            _split_user_template(template), "a {{b}}", ""
+        )
+        assert result == 'a {{b}}\n{"key": {"nested": 1}}'
+
     def test_short_readme_not_truncated(self) -> None:
         """Short README passes through unchanged."""
         template = "{readme_content}"
         short_readme = "Short README content"
-        result = _build_user_prompt(template, short_readme, "")
+        result = _build_user_prompt(
+            _split_user_template(template), short_readme, ""
+        )
         assert result == short_readme
 
 
@@ -125,6 +189,18 @@ class TestParseResponse:
         result = parse_response(raw)
         assert result is None
 
+    def test_braces_after_object(self) -> None:
+        """Braces in trailing prose do not extend the extracted object."""
+        raw = '```json\n{"key": "}"}\n```\nUse {placeholders} as needed.'
+        result = parse_response(raw)
+        assert result == {"key": "}"}
+
+    def test_invalid_escape_repaired(self) -> None:
+        """Invalid backslash escapes are sanitized before parsing."""
+        raw = '{"evidence": "run \\*make\\* then \\c", "ok": "a\\nb"}'
+        result = parse_response(raw)
+        assert result == {"evidence": "run \\*make\\* then \\c", "ok": "a\nb"}
+
     def test_no_json(self) -> None:
         """No JSON content returns None."""
         raw = "This response contains no JSON at all."
@@ -238,6 +314,75 @@ class TestExtractFields:
         assert isinstance(fields, dict)
 
 
+class TestFetchCandidates:
+    """Tests for batched candidate + file tree loading."""
+
+    @pytest.fixture()
+    def tmp_db(self, tmp_path: Path) -> Path:
+        """Create temp DB with three projects, one without a tree."""
+        db_path = tmp_path / "test.db"
+        init_db(db_path)
+        conn = open_connection(db_path)
+        for idx in range(3):
+            pid = conn.execute(
+                "INSERT INTO projects (source, source_id, name) "
+                "VALUES (?, ?, ?)",
+                ("test", f"fc_{idx}", f"Fetch {idx}"),
+            ).lastrowid
+            conn.execute(
+                "INSERT INTO readme_contents "
+                "(project_id, repo_url, content, size_bytes, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (pid, f"https://github.com/t/f{idx}", f"README {idx}",
+                 8, "2025-01-01T00:00:00Z"),
+            )
+            if idx == 2:
+                continue
+            conn.executemany(
+                "INSERT INTO repo_file_trees "
+                "(project_id, file_path, file_type, size_bytes) "
+                "VALUES (?, ?, ?, ?)",
+                [(pid, "src", "tree", None), (pid, "README.md", "blob", 8)],
+            )
+        conn.commit()
+        conn.close()
+        return db_path
+
+    def test_groups_trees_per_project(self, tmp_db: Path) -> None:
+        """Each candidate carries its own path-ordered tree entries."""
+        conn = open_connection(tmp_db)
+        result = _fetch_candidates(conn, "test_8")
+        conn.close()
+
+        assert [readme for _, readme, _ in result] == ["README 0", "README 1"]
+        for _, _, tree in result:
+            assert tree == [("README.md", "blob", 8), ("src", "tree", None)]
+
+    def test_limit(self, tmp_db: Path) -> None:
+        """Limit caps the number of candidates returned."""
+        conn = open_connection(tmp_db)
+        result = _fetch_candidates(conn, "test_8", limit=1)
+        conn.close()
+        assert len(result) == 1
+        assert result[0][1] == "README 0"
+
+    def test_long_readme_cut_past_limit(self, tmp_db: Path) -> None:
+        """Oversized READMEs arrive cut to one char past the limit."""
+        conn = open_connection(tmp_db)
+        conn.execute(
+            "UPDATE readme_contents SET content = ? "
+            "WHERE project_id = (SELECT MIN(project_id) FROM readme_contents)",
+            ("é" * (_MAX_README_CHARS * 2),),
+        )
+        result = _fetch_candidates(conn, "test_8", limit=1)
+        conn.close()
+
+        readme = result[0][1]
+        assert readme == "é" * (_MAX_README_CHARS + 1)
+        prompt = _build_user_prompt(("", "{readme_content}", ""), readme, "")
+        assert prompt.endswith("[README TRUNCATED]")
+
+
 class TestBatchJsonlFormat:
     """Tests for batch JSONL preparation."""
 
@@ -303,6 +448,285 @@ class TestBatchJsonlFormat:
                 assert "generation_config" in req
                 assert req["generation_config"]["temperature"] == 0
 
+    def test_no_candidates_keeps_previous_file(self, tmp_path: Path) -> None:
+        """With nothing left to evaluate, an earlier batch file survives."""
+        db_path = tmp_path / "empty.db"
+        init_db(db_path)
+        batch_dir = tmp_path / "batch"
+        batch_dir.mkdir()
+        previous = batch_dir / "gemini_batch_input.jsonl"
+        previous.write_bytes(b'{"key": "project_0"}\n')
+        with patch(
+            "osh_datasets.enrichment.llm_readme_eval._BATCH_DIR", batch_dir,
+        ), patch(
+            "osh_datasets.enrichment.llm_readme_eval._PROMPT_DIR",
+            Path(__file__).resolve().parents[1] / "prompt_evaluation" / "test_8",
+        ):
+            output = prepare_batch(db_path, prompt_version="test_8")
+
+        assert output == previous
+        assert previous.read_bytes() == b'{"key": "project_0"}\n'
+        assert [p.name for p in batch_dir.iterdir()] == [previous.name]
+
+
+class TestEstimateRequestTokens:
+    """Tests for the JSONL request token estimate."""
+
+    def test_never_underestimates_prompt_text(self) -> None:
+        """Estimate covers the system + user text of the request."""
+        system, user = "s" * 4000, 'line "quoted"\n' * 500
+        line = orjson.dumps({
+            "key": "project_1",
+            "request": {
+                "system_instruction": {"parts": [{"text": system}]},
+                "contents": [{"role": "user", "parts": [{"text": user}]}],
+                "generation_config": {
+                    "temperature": 0, "max_output_tokens": 8192,
+                },
+            },
+        })
+        true_tokens = (len(system) + len(user)) // 4
+        estimate = _estimate_request_tokens(line)
+        assert true_tokens <= estimate <= true_tokens * 1.3
+
+
+class TestSplitJsonl:
+    """Tests for splitting batch input into token-budgeted chunks."""
+
+    def test_splits_on_budget_and_skips_existing(self, tmp_path: Path) -> None:
+        """Lines are grouped under the budget; existing chunks are kept."""
+        lines = [
+            orjson.dumps({"key": f"project_{i}", "text": "x" * 400})
+            for i in range(5)
+        ]
+        input_path = tmp_path / "input.jsonl"
+        input_path.write_bytes(b"\n".join(lines) + b"\n\n")
+        (tmp_path / "batch_chunk_001.jsonl").write_bytes(b"existing\n")
+
+        with patch(
+            "osh_datasets.enrichment.llm_readme_eval._BATCH_DIR", tmp_path,
+        ), patch(
+            "osh_datasets.enrichment.llm_readme_eval._TOKEN_BUDGET", 130,
+        ):
+            chunks = _split_jsonl(input_path)
+
+        assert [c.name for c in chunks] == [
+            "batch_chunk_000.jsonl",
+            "batch_chunk_001.jsonl",
+            "batch_chunk_002.jsonl",
+        ]
+        assert chunks[0].read_bytes() == b"\n".join(lines[:2]) + b"\n"
+        assert chunks[1].read_bytes() == b"existing\n"
+        assert chunks[2].read_bytes() == lines[4] + b"\n"
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+class TestBatchRequestTemplate:
+    """Tests for the pre-serialized batch request wrapper."""
+
+    def test_matches_full_serialization(self) -> None:
+        """Spliced line is byte-identical to dumping the whole request."""
+        system = 'System with "quotes", % signs and \x00key\x00 text'
+        user = "User prompt \\ with escapes\nand unicode: \u00e9"
+        head, middle, tail = _batch_request_template(system)
+
+        line = (
+            head + orjson.dumps("project_7") + middle
+            + orjson.dumps(user) + tail
+        )
+
+        expected = orjson.dumps(
+            {
+                "key": "project_7",
+                "request": {
+                    "system_instruction": {"parts": [{"text": system}]},
+                    "contents": [
+                        {"role": "user", "parts": [{"text": user}]},
+                    ],
+                    "generation_config": {
+                        "temperature": 0,
+                        "max_output_tokens": _MAX_OUTPUT_TOKENS,
+                    },
+                },
+            },
+            option=orjson.OPT_APPEND_NEWLINE,
+        )
+        assert line == expected
+
+
+class TestDownloadBatchOutput:
+    """Tests for streaming batch result downloads."""
+
+    @staticmethod
+    def _stream(status: int, body: bytes) -> MagicMock:
+        httpx = pytest.importorskip("httpx")
+        resp = httpx.Response(
+            status, content=body, request=httpx.Request("GET", "https://x"),
+        )
+        stream = MagicMock()
+        stream.return_value.__enter__.return_value = resp
+        return stream
+
+    def test_writes_body(self, tmp_path: Path) -> None:
+        """Body is written to the output path with no temp file left."""
+        output = tmp_path / "batch_output_000.jsonl"
+        stream = self._stream(200, b'{"key": "project_1"}\n')
+        with patch("httpx.stream", stream):
+            _download_batch_output("key", "files/batch-1", output)
+
+        assert output.read_bytes() == b'{"key": "project_1"}\n'
+        assert not output.with_suffix(".jsonl.tmp").exists()
+        assert "files/batch-1:download" in stream.call_args.args[1]
+
+    def test_error_leaves_no_output(self, tmp_path: Path) -> None:
+        """A failed download does not create the output file."""
+        httpx = pytest.importorskip("httpx")
+        output = tmp_path / "batch_output_000.jsonl"
+        with (
+            patch("httpx.stream", self._stream(404, b"")),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            _download_batch_output("key", "files/batch-1", output)
+
+        assert not output.exists()
+
+
+class TestMergeResults:
+    """Tests for concatenating chunk result files."""
+
+    def _merge(self, tmp_path: Path) -> bytes:
+        (tmp_path / "batch_output_000.jsonl").write_bytes(b"a\nb")
+        (tmp_path / "batch_output_001.jsonl").write_bytes(b"")
+        (tmp_path / "batch_output_003.jsonl").write_bytes(b"c\n")
+        with patch(
+            "osh_datasets.enrichment.llm_readme_eval._BATCH_DIR", tmp_path,
+        ):
+            _merge_results(4)
+        return (tmp_path / "gemini_batch_output.jsonl").read_bytes()
+
+    def test_concatenates_with_newlines(self, tmp_path: Path) -> None:
+        """Chunks are joined in order, each newline-terminated."""
+        assert self._merge(tmp_path) == b"a\nb\nc\n"
+
+    def test_fallback_without_sendfile(self, tmp_path: Path) -> None:
+        """Merging still works where sendfile cannot copy files."""
+        with patch("os.sendfile", side_effect=OSError("unsupported")):
+            assert self._merge(tmp_path) == b"a\nb\nc\n"
+
+
+class TestSubmitBatch:
+    """Tests for advancing the chunked batch state machine."""
+
+    _MODULE = "osh_datasets.enrichment.llm_readme_eval"
+
+    def _run(
+        self,
+        tmp_path: Path,
+        download: MagicMock,
+        client: MagicMock | None = None,
+    ) -> MagicMock:
+        """Run submit with chunk 0 finished and chunk 1 not submitted."""
+        pytest.importorskip("google.genai")
+        input_path = tmp_path / "gemini_batch_input.jsonl"
+        input_path.write_bytes(b'{"key": "project_1"}\n')
+        (tmp_path / "batch_state.json").write_bytes(
+            orjson.dumps({"chunk_idx": 0, "job_name": "batches/old"})
+        )
+        chunks = [tmp_path / "c0.jsonl", tmp_path / "c1.jsonl"]
+
+        client = client or MagicMock()
+        client.batches.get.return_value.state.name = "JOB_STATE_SUCCEEDED"
+        client.batches.get.return_value.dest.file_name = "files/out-0"
+        client.files.upload.return_value.name = "files/in-1"
+        client.batches.create.return_value.name = "batches/new"
+        with (
+            patch("google.genai.Client", return_value=client),
+            patch.dict(os.environ, {"GEMINI_API_KEY": "key"}),
+            patch(f"{self._MODULE}._BATCH_DIR", tmp_path),
+            patch(f"{self._MODULE}._STATE_FILE", tmp_path / "batch_state.json"),
+            patch(f"{self._MODULE}._split_jsonl", return_value=chunks),
+            patch(f"{self._MODULE}._download_batch_output", download),
+        ):
+            submit_batch(input_path)
+        return client
+
+    def test_downloads_and_submits_next(self, tmp_path: Path) -> None:
+        """Finished results download and the next chunk is submitted."""
+        download = MagicMock()
+        client = self._run(tmp_path, download)
+
+        download.assert_called_once_with(
+            "key", "files/out-0", tmp_path / "batch_output_000.jsonl",
+        )
+        client.batches.create.assert_called_once()
+        state = orjson.loads((tmp_path / "batch_state.json").read_bytes())
+        assert state["chunk_idx"] == 1
+        assert state["job_name"] == "batches/new"
+
+    def test_skips_downloaded_chunks(self, tmp_path: Path) -> None:
+        """Chunks with existing output are skipped, then results merge."""
+        (tmp_path / "batch_output_001.jsonl").write_bytes(b"{}\n")
+        client = self._run(tmp_path, MagicMock())
+
+        client.files.upload.assert_not_called()
+        assert (tmp_path / "gemini_batch_output.jsonl").read_bytes() == b"{}\n"
+        assert not (tmp_path / "batch_state.json").exists()
+
+    def test_failed_download_keeps_state(self, tmp_path: Path) -> None:
+        """A failed download does not submit the next job."""
+        download = MagicMock(side_effect=OSError("network"))
+        client = MagicMock()
+        with pytest.raises(OSError, match="network"):
+            self._run(tmp_path, download, client)
+
+        state = orjson.loads((tmp_path / "batch_state.json").read_bytes())
+        assert state == {"chunk_idx": 0, "job_name": "batches/old"}
+        client.batches.create.assert_not_called()
+        client.files.delete.assert_called_once_with(name="files/in-1")
+
+
+class TestIterJsonlLines:
+    """Tests for memory-mapped JSONL line iteration."""
+
+    def test_splits_lines(self, tmp_path: Path) -> None:
+        """Blank lines and CR terminators are dropped; last line kept."""
+        path = tmp_path / "results.jsonl"
+        path.write_bytes(b'{"a": 1}\r\n\n{"b": 2}\n\r\n{"c": 3}')
+        assert list(_iter_jsonl_lines(path)) == [
+            b'{"a": 1}', b'{"b": 2}', b'{"c": 3}',
+        ]
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """An empty file yields nothing."""
+        path = tmp_path / "results.jsonl"
+        path.write_bytes(b"")
+        assert list(_iter_jsonl_lines(path)) == []
+
+
+class TestResponseText:
+    """Tests for locating the response text in a batch record."""
+
+    def test_text_found(self) -> None:
+        """The first candidate's first part text is returned."""
+        record = {
+            "response": {
+                "candidates": [{"content": {"parts": [{"text": "hi"}]}}],
+            },
+        }
+        assert _response_text(record) == "hi"
+
+    @pytest.mark.parametrize("response", [
+        {},
+        {"candidates": []},
+        {"candidates": [{}]},
+        {"candidates": [{"content": {"parts": []}}]},
+        {"candidates": [{"content": {"parts": [{"text": None}]}}]},
+        "not a dict",
+    ])
+    def test_missing_text(self, response: object) -> None:
+        """Incomplete or malformed records yield None."""
+        assert _response_text({"response": response}) is None
+
 
 class TestIngestBatchResults:
     """Tests for batch result ingestion."""
@@ -448,6 +872,196 @@ class TestIngestBatchResults:
         conn.close()
         assert total == 1
 
+    def test_skips_malformed_records(
+        self, tmp_db: Path, tmp_path: Path,
+    ) -> None:
+        """Records without a usable project key are skipped."""
+        conn = open_connection(tmp_db)
+        pid = conn.execute("SELECT id FROM projects LIMIT 1").fetchone()[0]
+        conn.close()
+
+        response = {
+            "candidates": [{"content": {"parts": [{"text": "{}"}]}}],
+        }
+        records = [
+            [1, 2],
+            {"response": response},
+            {"key": 7, "response": response},
+            {"key": "project_x", "response": response},
+            {"key": f"other_{pid}", "response": response},
+            {"key": f"project_{pid}", "response": response},
+        ]
+        results_path = tmp_path / "results.jsonl"
+        results_path.write_bytes(
+            b"".join(orjson.dumps(r) + b"\n" for r in records)
+        )
+
+        count = ingest_batch_results(
+            tmp_db, results_path=results_path, prompt_version="test_8"
+        )
+        assert count == 1
+
+    def test_flushes_in_batches(self, tmp_db: Path, tmp_path: Path) -> None:
+        """Rows spanning several executemany flushes are all stored."""
+        conn = open_connection(tmp_db)
+        conn.executemany(
+            "INSERT INTO projects (source, source_id, name) "
+            "VALUES (?, ?, ?)",
+            [("test", f"ingest_{i}", f"Ingest {i}") for i in (2, 3)],
+        )
+        conn.commit()
+        pids = [r[0] for r in conn.execute("SELECT id FROM projects")]
+        conn.close()
+
+        raw_text = '{"metadata": {"project_type": "hardware"}}'
+        results_path = tmp_path / "results.jsonl"
+        results_path.write_bytes(b"".join(
+            orjson.dumps({
+                "key": f"project_{pid}",
+                "response": {
+                    "candidates": [{
+                        "content": {"parts": [{"text": raw_text}]},
+                    }],
+                },
+            }) + b"\n"
+            for pid in pids
+        ))
+
+        with patch(
+            "osh_datasets.enrichment.llm_readme_eval._INGEST_BATCH_SIZE", 2,
+        ):
+            count = ingest_batch_results(
+                tmp_db, results_path=results_path, prompt_version="test_8"
+            )
+        assert count == 3
+
+        conn = open_connection(tmp_db)
+        rows = conn.execute(
+            "SELECT project_id, project_type FROM llm_evaluations "
+            "ORDER BY project_id"
+        ).fetchall()
+        conn.close()
+        assert [tuple(r) for r in rows] == [
+            (pid, "hardware") for pid in sorted(pids)
+        ]
+
+
+class TestTokenBucket:
+    """Tests for the realtime token-bucket rate limiter."""
+
+    def test_burst_does_not_block(self) -> None:
+        """Requests within the burst capacity return immediately."""
+        bucket = _TokenBucket(1000.0)
+        start = time.monotonic()
+        bucket.acquire(1000)
+        assert time.monotonic() - start < 0.05
+
+    def test_waits_for_refill(self) -> None:
+        """Drained bucket waits for the deficit to refill."""
+        bucket = _TokenBucket(1000.0)
+        bucket.acquire(1000)
+        start = time.monotonic()
+        bucket.acquire(100)
+        assert time.monotonic() - start >= 0.09
+
+
+class TestCallGeminiRealtime:
+    """Tests for the single realtime Gemini call wrapper."""
+
+    def test_returns_text_and_usage(self) -> None:
+        """Successful call returns text and token counts."""
+        pytest.importorskip("google.genai")
+        client = MagicMock()
+        resp = client.models.generate_content.return_value
+        resp.sdk_http_response.body = orjson.dumps({
+            "candidates": [{"content": {"parts": [
+                {"text": "thinking...", "thought": True},
+                {"text": '{"ok": true}'},
+            ]}}],
+            "usageMetadata": {
+                "promptTokenCount": 10,
+                "candidatesTokenCount": 5,
+            },
+        }).decode()
+
+        result = _call_gemini_realtime(client, "m", "sys", "user")
+
+        assert result == ('{"ok": true}', 10, 5)
+        config = client.models.generate_content.call_args.kwargs["config"]
+        assert config.http_options.timeout == 60_000
+        assert config.should_return_http_response is True
+
+    def test_empty_body(self) -> None:
+        """Missing body yields empty text and zero usage."""
+        pytest.importorskip("google.genai")
+        client = MagicMock()
+        client.models.generate_content.return_value.sdk_http_response.body = None
+
+        assert _call_gemini_realtime(client, "m", "sys", "user") == ("", 0, 0)
+
+    def test_non_json_body_returns_none(self) -> None:
+        """An undecodable body is reported as a failed call."""
+        pytest.importorskip("google.genai")
+        client = MagicMock()
+        client.models.generate_content.return_value.sdk_http_response.body = (
+            "<html>502</html>"
+        )
+
+        assert _call_gemini_realtime(client, "m", "sys", "user") is None
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "[]",
+            '{"candidates": [{"content": {"parts": ["x"]}}]}',
+            '{"candidates": ["x"], "usageMetadata": []}',
+            '{"candidates": {"0": {}}}',
+        ],
+    )
+    def test_malformed_body_has_no_text(self, body: str) -> None:
+        """Wrongly typed response nodes yield empty text, not an error."""
+        pytest.importorskip("google.genai")
+        client = MagicMock()
+        client.models.generate_content.return_value.sdk_http_response.body = body
+
+        assert _call_gemini_realtime(client, "m", "sys", "user") == ("", 0, 0)
+
+    def test_timeout_returns_none(self) -> None:
+        """SDK-level timeout is reported as a failed call."""
+        pytest.importorskip("google.genai")
+        httpx = pytest.importorskip("httpx")
+        client = MagicMock()
+        client.models.generate_content.side_effect = httpx.ReadTimeout("slow")
+
+        assert _call_gemini_realtime(client, "m", "sys", "user") is None
+        assert client.models.generate_content.call_count == 1
+
+    def test_rate_limit_honors_retry_delay(self) -> None:
+        """429 retries wait at least the server-provided retry delay."""
+        errors = pytest.importorskip("google.genai.errors")
+        exc = errors.APIError(429, {"error": {
+            "status": "RESOURCE_EXHAUSTED",
+            "details": [{
+                "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                "retryDelay": "30s",
+            }],
+        }})
+        assert _retry_after_seconds(exc) == 30.0
+
+        client = MagicMock()
+        client.models.generate_content.side_effect = exc
+        with patch(
+            "osh_datasets.enrichment.llm_readme_eval.time.sleep",
+        ) as mock_sleep:
+            assert _call_gemini_realtime(client, "m", "sys", "user") is None
+
+        assert client.models.generate_content.call_count == 3
+        assert all(c.args[0] >= 30.0 for c in mock_sleep.call_args_list)
+
+    def test_retry_after_absent(self) -> None:
+        """Errors without a retry hint yield None."""
+        assert _retry_after_seconds(RuntimeError("429")) is None
+
 
 class TestRunRealtime:
     """Tests for realtime Gemini evaluation."""
@@ -661,14 +1275,14 @@ class TestInputTruncation:
         """README at exactly the limit is not truncated."""
         template = "{readme_content}"
         readme = "x" * _MAX_README_CHARS
-        result = _build_user_prompt(template, readme, "")
+        result = _build_user_prompt(_split_user_template(template), readme, "")
         assert "[README TRUNCATED]" not in result
 
     def test_readme_truncation_over_limit(self) -> None:
         """README over the limit is truncated."""
         template = "{readme_content}"
         readme = "x" * (_MAX_README_CHARS + 1)
-        result = _build_user_prompt(template, readme, "")
+        result = _build_user_prompt(_split_user_template(template), readme, "")
         assert "[README TRUNCATED]" in result
 
     def test_tree_entry_truncation(self) -> None:
@@ -77,6 +77,27 @@ class TestHackadayLoader:
         assert row is not None
         assert row[0] > 1000
 
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            (None, []),
+            ("[]", []),
+            ("['a', ' b ', '']", ["a", "b"]),
+            ("[\"Tom's\", 'x']", ["Tom's", "x"]),
+            ("['it\\'s']", ["it's"]),
+            ("[1, 2]", ["1", "2"]),
+            ("[true]", []),
+            ("not a list", []),
+        ],
+    )
+    def test_parse_string_list(
+        self, raw: str | None, expected: list[str],
+    ) -> None:
+        """Python-literal tag lists parse via JSON or literal_eval."""
+        from osh_datasets.loaders.hackaday import _parse_string_list
+
+        assert _parse_string_list(raw) == expected
+
 
 class TestOshwaLoader:
     """Test OSHWA loader with real data."""
@@ -396,6 +417,84 @@ class TestHardwareioBomLoader:
         assert abs(row[1] - 2.50) < 0.01
 
 
+class TestJohLoader:
+    """Test Journal of Open Hardware loader."""
+
+    def test_loads_projects(self, db_path: Path) -> None:
+        """Each JOH paper becomes a project with one publication."""
+        data_file = (
+            DATA_DIR / "journal_of_open_hardware"
+            / "journal_of_open_hardware_papers.csv"
+        )
+        _skip_if_missing(data_file)
+
+        from osh_datasets.loaders.joh import JohLoader
+
+        count = JohLoader().run(db_path)
+        assert count > 0
+        assert _count_projects(db_path, "joh") == count
+
+        conn = open_connection(db_path)
+        row = conn.execute(
+            "SELECT COUNT(*), COUNT(cited_by_count) FROM publications"
+        ).fetchone()
+        conn.close()
+        assert row is not None
+        assert row[0] == count
+        assert row[1] > 0
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            (None, None),
+            ("", None),
+            ("https://example.com/x", None),
+            (
+                "see https://example.com, https://github.com/a/b; more",
+                "https://github.com/a/b",
+            ),
+            ("(https://gitlab.com/a/b)", "https://gitlab.com/a/b"),
+            ("https://GitHub.com/a/b", "https://GitHub.com/a/b"),
+            ("HTTPS://github.com/a/b", None),
+            (
+                "https://web.archive.org/web/https://github.com/a",
+                "https://web.archive.org/web/https://github.com/a",
+            ),
+            ("github.com/a/b", None),
+        ],
+    )
+    def test_first_repo_url(
+        self, text: str | None, expected: str | None,
+    ) -> None:
+        """The first http(s) URL mentioning GitHub/GitLab is returned."""
+        from osh_datasets.loaders.joh import _first_repo_url
+
+        assert _first_repo_url(text) == expected
+
+    def test_openalex_doi_index(self, tmp_path: Path) -> None:
+        """Only JOH rows are indexed, by normalized DOI, last one wins."""
+        from osh_datasets.loaders.joh import _build_openalex_doi_index
+
+        csv_path = tmp_path / "openalex.csv"
+        csv_path.write_text(
+            "doi,primary_location,cited_by_count,publication_year\n"
+            "https://doi.org/10.5334/JOH.1 ,Journal of Open Hardware,3,2020\n"
+            "https://doi.org/10.1/other,Some Other Journal,9,2019\n"
+            ",Journal of Open Hardware,1,2021\n"
+            "https://doi.org/10.5334/joh.1,Journal of Open Hardware,4,\n"
+        )
+
+        assert _build_openalex_doi_index(csv_path) == {
+            "10.5334/joh.1": {
+                "doi": "10.5334/joh.1",
+                "cited_by_count": "4",
+                "publication_year": None,
+                "open_access": None,
+            },
+        }
+        assert _build_openalex_doi_index(tmp_path / "missing.csv") == {}
+
+
 class TestAllLoadersSmoke:
     """Smoke test: run all loaders together."""
 
@@ -12,6 +12,7 @@ from osh_datasets.db import (
     open_connection,
     transaction,
     upsert_component_price,
+    upsert_component_prices,
     upsert_project,
 )
 
@@ -122,6 +123,42 @@ class TestComponentPricesTable:
         assert abs(row[0] - 0.45) < 1e-6
         assert row[1] == "2026-02-01"
 
+    def test_batch_upsert(self, db_path: Path) -> None:
+        """Batch upsert inserts rows and later duplicates win."""
+        with transaction(db_path) as conn:
+            pid = upsert_project(
+                conn, source="t", source_id="1", name="P",
+            )
+            insert_bom_component(conn, pid, component_name="LED")
+
+        conn = open_connection(db_path)
+        bom_id = conn.execute(
+            "SELECT id FROM bom_components LIMIT 1"
+        ).fetchone()[0]
+
+        upsert_component_prices(conn, [
+            (bom_id, None, "Mouser", 0.50, "USD", 1,
+             "2026-01-01", "nexar"),
+            (bom_id, None, "Mouser", 0.30, "USD", 100,
+             "2026-01-01", "nexar"),
+            (bom_id, "LED-1", "Mouser", 0.45, "USD", 1,
+             "2026-02-01", "nexar"),
+        ])
+        conn.commit()
+
+        rows = conn.execute(
+            "SELECT matched_mpn, unit_price, quantity_break "
+            "FROM component_prices WHERE bom_component_id = ? "
+            "ORDER BY quantity_break",
+            (bom_id,),
+        ).fetchall()
+        conn.close()
+
+        assert [tuple(r) for r in rows] == [
+            ("LED-1", 0.45, 1),
+            (None, 0.30, 100),
+        ]
+
     def test_index_exists(self, db_path: Path) -> None:
         """Index on bom_component_id is created."""
         conn = open_connection(db_path)
@@ -396,6 +433,141 @@ class TestPricingEnrichment:
         count = enrich_from_nexar(db_path, json_path)
         assert count == 0
 
+    def test_enrich_from_nexar_coerces_prices(
+        self, db_path: Path, tmp_path: Path,
+    ) -> None:
+        """Numeric strings are accepted and non-numeric prices skipped."""
+        from osh_datasets.enrichment.pricing import enrich_from_nexar
+
+        with transaction(db_path) as conn:
+            pid = upsert_project(
+                conn, source="t", source_id="1", name="P",
+            )
+            insert_bom_component(conn, pid, component_name="LED")
+
+        conn = open_connection(db_path)
+        bom_id = conn.execute(
+            "SELECT id FROM bom_components LIMIT 1"
+        ).fetchone()[0]
+        conn.close()
+
+        base = {"bom_component_id": bom_id, "price_date": "2026-02-20"}
+        json_path = tmp_path / "nexar_prices.json"
+        json_path.write_bytes(orjson.dumps([
+            {**base, "distributor": "A", "unit_price": "1.5"},
+            {**base, "distributor": "B", "unit_price": 2},
+            {**base, "distributor": "C", "unit_price": "call"},
+            {**base, "distributor": "D", "unit_price": True},
+            {**base, "distributor": "E", "unit_price": 3.0,
+             "quantity_break": "10"},
+        ]))
+
+        assert enrich_from_nexar(db_path, json_path) == 3
+
+        conn = open_connection(db_path)
+        rows = conn.execute(
+            "SELECT distributor, unit_price, quantity_break "
+            "FROM component_prices ORDER BY distributor"
+        ).fetchall()
+        conn.close()
+        assert [tuple(r) for r in rows] == [
+            ("A", 1.5, 1), ("B", 2.0, 1), ("E", 3.0, 10),
+        ]
+
+    def test_enrich_pricing_all_sources(
+        self, db_path: Path, tmp_path: Path,
+    ) -> None:
+        """enrich_pricing loads every source in one pass."""
+        from osh_datasets.enrichment import pricing
+
+        with transaction(db_path) as conn:
+            pid = upsert_project(
+                conn, source="t", source_id="1", name="P",
+            )
+            insert_bom_component(conn, pid, component_name="LED")
+
+        conn = open_connection(db_path)
+        bom_id = conn.execute(
+            "SELECT id FROM bom_components LIMIT 1"
+        ).fetchone()[0]
+        conn.close()
+
+        nexar_json = tmp_path / "nexar.json"
+        nexar_json.write_bytes(orjson.dumps([{
+            "bom_component_id": bom_id, "distributor": "DigiKey",
+            "unit_price": 0.25, "price_date": "2026-02-20",
+        }]))
+        ebay_json = tmp_path / "ebay.json"
+        ebay_json.write_bytes(orjson.dumps([{
+            "bom_component_id": bom_id, "seller": "shop",
+            "unit_price": "0.20", "price_date": "2026-02-21",
+        }]))
+
+        with (
+            patch.object(pricing, "_NEXAR_JSON", nexar_json),
+            patch.object(pricing, "_PARTSTABLE_JSON", tmp_path / "none"),
+            patch.object(pricing, "_EBAY_JSON", ebay_json),
+        ):
+            assert pricing.enrich_pricing(db_path) == 2
+
+        conn = open_connection(db_path)
+        rows = conn.execute(
+            "SELECT distributor, price_source FROM component_prices "
+            "ORDER BY distributor"
+        ).fetchall()
+        conn.close()
+        assert [tuple(r) for r in rows] == [
+            ("DigiKey", "nexar"), ("ebay:shop", "ebay"),
+        ]
+
+    def test_enrich_from_partstable(
+        self, db_path: Path, tmp_path: Path,
+    ) -> None:
+        """PartsTable content blocks are parsed into price rows."""
+        from osh_datasets.enrichment.pricing import enrich_from_partstable
+
+        with transaction(db_path) as conn:
+            pid = upsert_project(
+                conn, source="t", source_id="1", name="P",
+            )
+            insert_bom_component(conn, pid, component_name="LED")
+
+        conn = open_connection(db_path)
+        bom_id = conn.execute(
+            "SELECT id FROM bom_components LIMIT 1"
+        ).fetchone()[0]
+        conn.close()
+
+        items = [
+            {"price": "$0.40", "mpn": "LED-A", "distributor": "DigiKey"},
+            {"unitPrice": 0.35, "vendor": "Mouser"},
+            {"price": "n/a", "distributor": "Arrow"},
+        ]
+        records = [{
+            "bom_component_id": bom_id,
+            "search_results": [
+                {"type": "text", "text": "no json here"},
+                {"type": "text", "text": orjson.dumps(items).decode()},
+            ],
+        }]
+        json_path = tmp_path / "partstable_prices.json"
+        json_path.write_bytes(orjson.dumps(records))
+
+        count = enrich_from_partstable(db_path, json_path)
+        assert count == 2
+
+        conn = open_connection(db_path)
+        rows = conn.execute(
+            "SELECT distributor, matched_mpn, unit_price, price_source "
+            "FROM component_prices ORDER BY distributor"
+        ).fetchall()
+        conn.close()
+
+        assert [tuple(r) for r in rows] == [
+            ("DigiKey", "LED-A", 0.40, "partstable"),
+            ("Mouser", None, 0.35, "partstable"),
+        ]
+
 
 class TestFredPpi:
     """Tests for FRED PPI historical price adjustment."""